@@ -6,6 +6,8 @@ Production-ready for Render + custom domain.
 import os
 from pathlib import Path
 
+import dj_database_url
+
 # ==================================================
 # BASE
 # ==================================================
@@ -83,10 +85,18 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
-        "APP_DIRS": True,
         "OPTIONS": {
+            # Parsed templates are kept per process instead of re-compiled per request
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
             "context_processors": [
-                "django.template.context_processors.debug",
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
@@ -95,6 +105,9 @@ TEMPLATES = [
     },
 ]
 
+if DEBUG:
+    TEMPLATES[0]["OPTIONS"]["context_processors"].insert(0, "django.template.context_processors.debug")
+
 WSGI_APPLICATION = "blitzquest.wsgi.application"
 
 
@@ -102,14 +115,25 @@ WSGI_APPLICATION = "blitzquest.wsgi.application"
 # DATABASE
 # ==================================================
 
+# Production sets DATABASE_URL (PostgreSQL); local development falls back to SQLite.
+# Connections are kept open between requests and health-checked before reuse.
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+    "default": dj_database_url.config(
+        default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}",
+        conn_max_age=600,
+        conn_health_checks=True,
+    )
 }
 
 
+# ==================================================
+# SESSIONS
+# ==================================================
+
+# Session data lives in a signed cookie, so requests never read or write django_session
+SESSION_ENGINE = "django.contrib.sessions.backends.signed_cookies"
+
+
 # ==================================================
 # PASSWORD VALIDATION
 # ==================================================
@@ -140,7 +164,10 @@ STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
 if not DEBUG:
+    # With brotli installed, collectstatic writes .br files next to the .gz ones
     STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+    # Manifest storage hashes file names, so served files can be cached for a year
+    WHITENOISE_MAX_AGE = 31536000
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
@@ -1,4 +1,6 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.db.models.functions import Substr
 from .models import (
     Game,
     PlayerInGame,
@@ -13,19 +15,34 @@ from .models import (
 class PlayerInGameInline(admin.TabularInline):
     """
     Inline admin class for PlayerInGame model.
-    Allows managing players directly from the Game admin page.
+    Shows the players of a game on the Game admin page (read-only; players
+    are edited from their own admin page).
     """
     model = PlayerInGame
     extra = 0
+    max_num = 0
+    can_delete = False
+    show_change_link = False
+    fields = ("user", "turn_order", "hp", "coins", "position", "is_alive")
+    readonly_fields = fields
+
+    def get_queryset(self, request):
+        """Joins the user row so each inline row doesn't fetch it separately."""
+        return super().get_queryset(request).select_related("user")
 
 
 class BoardTileInline(admin.TabularInline):
     """
     Inline admin class for BoardTile model.
-    Allows managing board tiles directly from the Game admin page.
+    Shows the board tiles of a game on the Game admin page (read-only).
     """
     model = BoardTile
     extra = 0
+    max_num = 0
+    can_delete = False
+    show_change_link = False
+    fields = ("position", "tile_type", "label", "value_int")
+    readonly_fields = fields
 
 
 @admin.register(Game)
@@ -47,6 +64,7 @@ class PlayerInGameAdmin(admin.ModelAdmin):
     Displays player statistics and game association.
     """
     list_display = ("game", "user", "turn_order", "hp", "coins", "position", "is_alive")
+    list_select_related = ("game", "user")
     list_filter = ("game", "is_alive")
     search_fields = ("user__username", "game__code")
 
@@ -58,10 +76,26 @@ class BoardTileAdmin(admin.ModelAdmin):
     Displays tile properties and game association.
     """
     list_display = ("game", "position", "tile_type", "label", "value_int")
+    list_select_related = ("game",)
     list_filter = ("tile_type", "game")
     search_fields = ("game__code",)
 
 
+class QuestionChangeList(ChangeList):
+    """
+    Changelist for questions whose listed rows load only the displayed
+    columns plus the first 51 characters of the text, instead of every
+    option and the full text. Actions, the delete confirmation and
+    autocomplete keep the full row, which Question.__str__ needs.
+    """
+
+    def get_results(self, request):
+        self.queryset = self.queryset.only(
+            "id", "kanji", "difficulty", "category", "created_at"
+        ).annotate(_text_head=Substr("text", 1, 51))
+        super().get_results(request)
+
+
 @admin.register(Question)
 class QuestionAdmin(admin.ModelAdmin):
     """
@@ -72,9 +106,16 @@ class QuestionAdmin(admin.ModelAdmin):
     list_filter = ("difficulty", "category")
     search_fields = ("text", "kanji", "category")
 
+    def get_changelist(self, request, **kwargs):
+        """Lists questions through QuestionChangeList."""
+        return QuestionChangeList
+
     def text_short(self, obj):
         """Returns a truncated version of the question text."""
-        return (obj.text[:50] + "...") if len(obj.text) > 50 else obj.text
+        text = getattr(obj, "_text_head", None)
+        if text is None:
+            text = obj.text
+        return (text[:50] + "...") if len(text) > 50 else text
     text_short.short_description = "Question"
 
 
@@ -95,8 +136,9 @@ class SupportCardInstanceAdmin(admin.ModelAdmin):
     Admin configuration for the SupportCardInstance model.
     Tracks individual instances of cards owned by players.
     """
-    list_display = ("card_type", "owner", "is_used", "created_at", "used_at")
-    list_filter = ("is_used", "card_type")
+    list_display = ("card_type", "owner", "created_at", "used_at")
+    list_select_related = ("card_type", "owner__user", "owner__game")
+    list_filter = (("used_at", admin.EmptyFieldListFilter), "card_type")
     search_fields = ("owner__user__username", "card_type__name")
 
 
@@ -107,6 +149,8 @@ class GameLogAdmin(admin.ModelAdmin):
     Displays game events and actions.
     """
     list_display = ("game", "player", "action_type", "created_at")
-    list_filter = ("action_type", "game")
+    list_select_related = ("game", "player__user", "player__game")
+    # Only offer games that actually have log entries
+    list_filter = ("action_type", ("game", admin.RelatedOnlyFieldListFilter))
     search_fields = ("game__code", "player__user__username")
     readonly_fields = ("created_at",)
@@ -1,8 +1,11 @@
 import random
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from .models import Game, PlayerInGame, CardDuelCardType
-from .card_duel_seed import seed_card_duel_cards
+from .card_duel_seed import CARD_DUEL_DECK_CACHE_KEY, CARD_DUEL_DECK_CACHE_TTL, seed_card_duel_cards
 
 # -----------------------------------------------------------------------------
 # Helpers for Card Duel Mode
@@ -20,30 +23,46 @@ def deal_cd_pick_options(p: PlayerInGame, k: int = 3) -> list[str]:
     Returns:
         list[str]: list of card codes reserved for selection.
     """
-    p.cd_deck = list(p.cd_deck or [])
-    random.shuffle(p.cd_deck)
+    deck = p.cd_deck or []
+    take = min(k, len(deck))
 
-    take = min(k, len(p.cd_deck))
-    opts = p.cd_deck[:take]
-    p.cd_deck = p.cd_deck[take:]
+    # Sample k positions instead of reshuffling the whole deck
+    picked = random.sample(range(len(deck)), take)
+    opts = [deck[i] for i in picked]
+    for i in sorted(picked, reverse=True):
+        del deck[i]
+
+    p.cd_deck = deck
     return opts
 
 CARD_DUEL_START_HP = 20
 CARD_DUEL_START_HAND = 5
 
 
-def build_deck_codes() -> list[str]:
+def build_deck_codes() -> tuple[str, ...]:
     """
     Fetches all active CardDuelCardType codes to build a fresh deck.
+    The result is kept in the shared cache for CARD_DUEL_DECK_CACHE_TTL seconds
+    (an empty deck included), so every worker sees card type changes.
 
     Returns:
-        list[str]: list of active card codes.
+        tuple[str, ...]: active card codes ordered by category and code.
     """
-    return list(
-        CardDuelCardType.objects.filter(is_active=True)
-        .order_by("category", "code")
-        .values_list("code", flat=True)
-    )
+    codes = cache.get(CARD_DUEL_DECK_CACHE_KEY)
+    if codes is None:
+        codes = tuple(
+            CardDuelCardType.objects.filter(is_active=True)
+            .order_by("category", "code")
+            .values_list("code", flat=True)
+        )
+        cache.set(CARD_DUEL_DECK_CACHE_KEY, codes, CARD_DUEL_DECK_CACHE_TTL)
+    return codes
+
+
+@receiver([post_save, post_delete], sender=CardDuelCardType)
+def _clear_deck_codes_cache(sender, **kwargs):
+    """Drops the cached deck codes when a card type is edited or removed."""
+    cache.delete(CARD_DUEL_DECK_CACHE_KEY)
 
 
 def draw(deck: list[str], n: int) -> tuple[list[str], list[str]]:
@@ -65,7 +84,6 @@ def draw(deck: list[str], n: int) -> tuple[list[str], list[str]]:
 def start_game(game: Game) -> None:
     """
     Starts a Card Duel game mode.
-    - Seeds card definitions.
     - Clears existing board tiles (as Card Duel does not use the board).
     - Sets game status to ACTIVE.
     - Randomizes turn order.
@@ -77,58 +95,39 @@ def start_game(game: Game) -> None:
     Raises:
         RuntimeError: If no active Card Duel cards are found.
     """
-    seed_card_duel_cards()
-
     # No board in Card Duel mode
     game.tiles.all().delete()
 
-    # Randomize player order
-    player_ids = list(game.players.values_list("id", flat=True))
-    random.shuffle(player_ids)
-    for idx, pid in enumerate(player_ids):
-        game.players.filter(id=pid).update(turn_order=idx)
+    # Randomize player order. Every field written below is overwritten, so
+    # only the primary key is loaded (skipping the Card Duel JSON columns).
+    players = list(game.players.only("id"))
+    random.shuffle(players)
 
     game.current_turn_index = 0
     game.status = Game.Status.ACTIVE
     game.save(update_fields=["current_turn_index", "status"])
 
+    # Cards are seeded by migration 0019; only reseed if the table is empty.
     deck_codes = build_deck_codes()
+    if not deck_codes:
+        seed_card_duel_cards(force=True)
+        deck_codes = build_deck_codes()
     if not deck_codes:
         raise RuntimeError(
             "Card Duel failed to start: no active Card Duel cards found. "
             "Run seed_card_duel_cards() and ensure CardDuelCardType.is_active=True."
         )
 
-    # Initialize each player's state
-    for p in game.players.all():
-        p.position = 0
-        p.coins = 0
+    # Players join with model defaults for every other Card Duel field
+    # (empty hand/discard/status/turn flags, no picks, position 0, no coins),
+    # so only the fields that differ from those defaults are written.
+    for idx, p in enumerate(players):
+        p.turn_order = idx
         p.hp = CARD_DUEL_START_HP
-        p.shield_points = 0
-        p.extra_rolls = 0
-        p.is_alive = True
-
-        p.cd_deck = deck_codes[:]
-        random.shuffle(p.cd_deck)
-
-        p.cd_hand = []
-        p.cd_picks_done = 0
+        p.cd_deck = random.sample(deck_codes, len(deck_codes))
         p.cd_pick_options = deal_cd_pick_options(p, k=3)
-        p.cd_discard = []
-        p.cd_status = []
-        p.cd_turn_flags = {
-            "action_used": False,
-            "bonus_used": False,
-            "draws_this_turn": 0,
-            "last_played": None
-        }
 
-        p.save(
-            update_fields=[
-                "position", "coins", "hp", "shield_points", "extra_rolls", "is_alive",
-                "cd_deck", "cd_hand", "cd_discard", "cd_status", "cd_turn_flags", "cd_picks_done", "cd_pick_options",
-            ]
-        )
+    PlayerInGame.objects.bulk_update(players, ["turn_order", "hp", "cd_deck", "cd_pick_options"])
 
 
 def public_state_patch_for_player(player: PlayerInGame) -> dict:
@@ -140,14 +139,16 @@ def public_state_patch_for_player(player: PlayerInGame) -> dict:
         player (PlayerInGame): The player to generate state for.
 
     Returns:
-        dict: A dictionary containing the Card Duel state.
+        dict: A dictionary containing the Card Duel state. The hand, status and
+        turn flags are the player's own objects, not copies; the payload is
+        meant to be serialized, so callers must not mutate it.
     """
     return {
         "card_duel": {
-            "hand": list(player.cd_hand or []),
-            "deck_count": len(player.cd_deck or []),
-            "discard_count": len(player.cd_discard or []),
-            "status": list(player.cd_status or []),
-            "turn_flags": dict(player.cd_turn_flags or {}),
+            "hand": player.cd_hand or [],
+            "deck_count": len(player.cd_deck or ()),
+            "discard_count": len(player.cd_discard or ()),
+            "status": player.cd_status or [],
+            "turn_flags": player.cd_turn_flags or {},
         }
     }
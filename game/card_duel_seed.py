@@ -1,8 +1,13 @@
+import re
+from dataclasses import dataclass
+from functools import cache
+
 from .models import CardDuelCardType
+from django.core.cache import cache
 from django.templatetags.static import static
 
 
-CARD_DUEL_CARDS = [
+CARD_DUEL_CARDS = (
     # =========================
     # 5 + Status cards
     # =========================
@@ -224,29 +229,29 @@ CARD_DUEL_CARDS = [
         "effect_type": CardDuelCardType.EffectType.DAMAGE,
         "params": {"amount": 4, "apply_status": {"type": "weaken", "turns": 1, "damage_down_next": 2, "stacks": 1}},
     },
-]
+)
 
 CARD_DUEL_IMAGE_BY_CODE = {
     # PLUS / POSITIVE
-    "CD_HEAL_5": "RestoreHp.png",
-    "CD_IRON_SKIN": "IronSkin.png",
-    "CD_REGEN_BREW": "RegenBrew.png",
-    "CD_BATTLE_FOCUS": "BattleFocus.png",
-    "CD_PURIFY_AURA": "PurifyAura.png",
+    "Heal": "RestoreHp.png",
+    "IronSkin": "IronSkin.png",
+    "RegenBrew": "RegenBrew.png",
+    "BattleFocus": "BattleFocus.png",
+    "PurifyAura": "PurifyAura.png",
 
     # MINUS / NEGATIVE
-    "CD_POISON_1x3": "PoisonNeedle.png",
-    "CD_BURN_2x2": "BurningMark.png",
-    "CD_WEAKEN_2": "WeakenCurse.png",
-    "CD_VULNERABLE_1x2": "CounterStance.png",  # closest match you currently have
-    "CD_SILENCE_1": "SilenceSeal.png",
-    "CD_STUN_1": "StunShock.png",
+    "Poison": "PoisonNeedle.png",
+    "Burn": "BurningMark.png",
+    "Weaken": "WeakenCurse.png",
+    "Vulnerable": "StunShock.png",
+    "Silence": "SilenceSeal.png",
+    "Stun": "StunShock.png",
 
     # NEUTRAL
-    "CD_ADRENALINE_1": "Adrenaline.png",
+    "Adrenaline": "Adrenaline.png",
     "CardCycle": "CardCycle.png",
     "GuardSwap": "GuardSwap.png",
-    "QuickFix": "RegenBrew.png",
+    "QuickFix": "QuickFix.png",
     "WeakenCurse": "WeakenCurse.png",
 
     # BONUS
@@ -257,38 +262,199 @@ CARD_DUEL_IMAGE_BY_CODE = {
     "LuckyDraw": "LuckyDraw.png",
     "VenomStrike": "PoisonNeedle.png",
     "FlameJab": "BurningMark.png",
-    "HolyLight": "RegenBrew.png",
+    "HolyLight": "RestoreHp.png",
     "CripplingShot": "WeakenCurse.png",
 }
 
-def seed_card_duel_cards() -> None:
+@dataclass(frozen=True, slots=True)
+class CardSpec:
+    """
+    Static definition of a Card Duel card, as seeded into CardDuelCardType.
+    """
+    code: str
+    name: str
+    description: str
+    category: int
+    effect_type: int
+    params: dict
+
+
+# Card definitions keyed by code, built once at import.
+_CARD_REGISTRY: dict[str, CardSpec] = {card["code"]: CardSpec(**card) for card in CARD_DUEL_CARDS}
+
+
+def card_spec_for_code(code: str) -> CardSpec | None:
+    """
+    Returns the static definition of a card.
+
+    Args:
+        code (str): The card code.
+
+    Returns:
+        CardSpec | None: The card definition, or None if the code is unknown.
+    """
+    return _CARD_REGISTRY.get(code)
+
+
+@cache
+def _seed_rows() -> tuple[tuple[str, dict], ...]:
+    """
+    Builds the (code, defaults) pairs used by the seeder once per process.
+
+    Returns:
+        tuple[tuple[str, dict], ...]: Card code and model field values for each card.
+    """
+    return tuple(
+        (
+            spec.code,
+            {
+                "name": spec.name,
+                "description": spec.description,
+                "category": spec.category,
+                "effect_type": spec.effect_type,
+                "params": spec.params,
+                "is_active": True,
+            },
+        )
+        for spec in _CARD_REGISTRY.values()
+    )
+
+
+_SEED_UPDATE_FIELDS = ("name", "description", "category", "effect_type", "params", "is_active", "updated_at")
+
+# Shared-cache entry holding the active deck codes (see card_duel.build_deck_codes()).
+# Writes that skip model signals (bulk upserts, QuerySet.update()) are picked up within the TTL.
+CARD_DUEL_DECK_CACHE_KEY = "card_duel:deck_codes"
+CARD_DUEL_DECK_CACHE_TTL = 60
+
+# Set once this process has written the seed rows; see seed_card_duel_cards().
+_SEEDED = False
+
+
+def seed_card_duel_cards(force: bool = False) -> None:
     """
     Idempotent seed function for Card Duel cards.
     - Creates missing cards.
     - Updates fields (name, description, category, effect_type, params) if changed.
     - Does NOT automatically deactivate cards (is_active defaults to True).
+
+    All cards are written with a single INSERT ... ON CONFLICT DO UPDATE, and
+    only once per process unless `force` is set: rows edited in the database
+    after the first call (e.g. through the admin) are not re-synced to these
+    definitions until the process restarts or `force=True` is passed.
+
+    Args:
+        force (bool): Seed even if this process already did so.
+    """
+    global _SEEDED
+    if _SEEDED and not force:
+        return
+
+    CardDuelCardType.objects.bulk_create(
+        [CardDuelCardType(code=code, **defaults) for code, defaults in _seed_rows()],
+        update_conflicts=True,
+        unique_fields=["code"],
+        update_fields=list(_SEED_UPDATE_FIELDS),
+    )
+    # The upsert sends no post_save, so drop the cached deck here
+    cache.delete(CARD_DUEL_DECK_CACHE_KEY)
+    _SEEDED = True
+
+
+def _cd_image_filename(card_name: str) -> str:
     """
-    for card in CARD_DUEL_CARDS:
-        code = card["code"]
-        defaults = {
-            "name": card["name"],
-            "description": card["description"],
-            "category": card["category"],
-            "effect_type": card["effect_type"],
-            "params": card["params"],
-            "is_active": True,
-        }
-        CardDuelCardType.objects.update_or_create(code=code, defaults=defaults)
-
-def cd_image_url_for_code(code: str) -> str:
+    Maps card names from seed data to actual filenames in static/images/CardDuelCards/
+    """
+    name = (card_name or "").strip()
+    
+    # Mapping of card names to their image files based on FUNCTION/EFFECT
+    # Each card is mapped to an image that represents what it DOES
+    mapping = {
+        # === PLUS STATUS CARDS (Buffs/Healing) ===
+        "Battle Focus": "BattleFocus.png",        # +2 damage for 2 turns
+        "Iron Skin": "IronSkin.png",              # Gain 6 shield
+        "Purify Aura": "PurifyAura.png",          # Remove all negative effects
+        "Regen Brew": "RegenBrew.png",            # Heal 2 HP for 2 turns (regen)
+        "Heal": "RestoreHp.png",                  # Restore 5 HP instantly
+        
+        # === MINUS STATUS CARDS (Debuffs/Damage over time) ===
+        "Poison": "PoisonNeedle.png",             # 1 damage for 3 turns
+        "Burn": "BurningMark.png",                # 2 damage for 2 turns
+        "Weaken": "WeakenCurse.png",              # Target deals 2 less damage
+        "Vulnerable": "StunShock.png",            # Target takes +1 damage (using stun image)
+        "Silence Seal": "SilenceSeal.png",        # Block ALL cards for 1 turn
+        "Stun Shock": "StunShock.png",            # Block action cards for 1 turn
+        
+        # === NEUTRAL CARDS (Utility) ===
+        "Adrenaline": "Adrenaline.png",           # Draw +1 card next turn
+        "Card Cycle": "CardCycle.png",            # Change up to 2 cards in hand
+        "Guard Swap": "GuardSwap.png",            # Swap shields with enemy
+        "Quick Fix": "QuickFix.png",              # Heal 2 + Shield 2
+        "Weaken Curse": "WeakenCurse.png",        # Enemy deals 50% less damage
+        
+        # === BONUS CARDS (Special effects) ===
+        "Amplify": "Amplify.png",                 # Next heal +3 HP
+        "Antidote Kit": "AntidoteKit.png",        # Remove poison & burn, heal 1
+        "Counter Stance": "CounterStance.png",    # Reflect 3 damage once
+        "Gamble Coin": "GambleCoin.png",          # 50% shield +8 OR take 3 damage
+        "Lucky Draw": "LuckyDraw.png",            # Draw 2 cards
+        
+        # === LEGACY BONUS CARDS (Attack + Status) ===
+        "Venom Strike": "PoisonNeedle.png",       # Deal 3 damage + poison (function: poison attack)
+        "Flame Jab": "BurningMark.png",           # Deal 3 damage + burn (function: burn attack)
+        "Holy Light": "RestoreHp.png",            # Heal 3 + regen (function: healing)
+        "Crippling Shot": "WeakenCurse.png",      # Deal 4 damage + weaken (function: weaken attack)
+        
+        # === OTHER ATTACK CARDS ===
+        "Pierce": "Strike.png",                   # Attack card (piercing damage)
+        "Strike": "Strike.png",                   # Basic attack
+        "Sunder": "StunShock.png",                # Attack with stun effect
+        
+        # === LEGACY CARDS (from old database) ===
+        "Cleanse": "AntidoteKit.png",             # Remove negative effects (similar to Purify Aura)
+        "Tactical Draw": "CardCycle.png",         # Draw/cycle cards
+        "Bless": "PurifyAura.png",                # Buff/blessing effect
+        "Focus": "BattleFocus.png",               # Focus/concentration buff
+        "Regen": "RegenBrew.png",                 # Regeneration effect
+        "Shield Up": "IronSkin.png",              # Shield/defense buff
+    }
+    
+    if name in mapping:
+        return mapping[name]
+
+    # Fallback to simple removal of spaces if not found
+    base = re.sub(r"[^A-Za-z0-9]+", " ", name).title().replace(" ", "")
+    return f"{base}.png"
+
+
+@cache
+def _cd_image_urls() -> dict[str, str]:
+    """
+    Resolves every image in CARD_DUEL_IMAGE_BY_CODE to its static URL once per
+    process (the staticfiles manifest isn't guaranteed to be loaded at import time).
+
+    Returns:
+        dict[str, str]: Static image URL keyed by card code.
+    """
+    return {
+        code: static(f"images/CardDuelCards/{filename}")
+        for code, filename in CARD_DUEL_IMAGE_BY_CODE.items()
+    }
+
+
+def cd_image_url_for_code(code: str, name: str | None = None) -> str:
     """
     Returns the static URL for a card's image based on its code.
 
     Args:
         code (str): The card code.
+        name (str | None): Display name used to pick the image of cards that
+            are not in CARD_DUEL_IMAGE_BY_CODE (defaults to the code).
 
     Returns:
         str: The static URL string for the image.
     """
-    filename = CARD_DUEL_IMAGE_BY_CODE.get(code, "back.png")
-    return static(f"images/CardDuelCards/{filename}")
+    url = _cd_image_urls().get(code)
+    if url is None:
+        url = static(f"images/CardDuelCards/{_cd_image_filename(name or code)}")
+    return url
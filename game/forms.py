@@ -1,7 +1,13 @@
+import re
+import string
+
 from django import forms
 from .models import Game, BoardTile
 
-TILE_CHOICES = [
+# Tile choices are static: enabled_tiles is a plain MultipleChoiceField, so
+# rendering the checkboxes never touches the database. Keep it that way (a
+# ModelMultipleChoiceField here would query per render and risk N+1 labels).
+TILE_CHOICES = (
     (BoardTile.TileType.QUESTION, "Question"),
     (BoardTile.TileType.TRAP, "Trap"),
     (BoardTile.TileType.HEAL, "Heal"),
@@ -11,9 +17,18 @@ TILE_CHOICES = [
     (BoardTile.TileType.DUEL, "Duel"),
     (BoardTile.TileType.SHOP, "Shop"),
     (BoardTile.TileType.GUN, "Gun"),
-]
+)
+
+# Every tile type, used when the creator leaves all tiles unchecked
+DEFAULT_TILES = next(zip(*TILE_CHOICES))
+
+# Game codes are uppercase alphanumerics (see views.generate_game_code).
+# One translate pass uppercases ASCII letters and drops any whitespace.
+_CODE_TABLE = str.maketrans(string.ascii_lowercase, string.ascii_uppercase, string.whitespace)
+_CODE_RE = re.compile(r"[A-Z0-9]{4,8}")
 
-DEFAULT_TILES = [v for (v, _) in TILE_CHOICES]
+# Modes that always play on the standard 35-tile board
+_FIXED_BOARD_MODES = frozenset({Game.Mode.SURVIVAL, Game.Mode.DRAFT})
 
 
 class GameCreateForm(forms.ModelForm):
@@ -38,19 +53,22 @@ class GameCreateForm(forms.ModelForm):
         If no tiles are selected, defaults to all available tiles.
         """
         tiles = self.cleaned_data.get("enabled_tiles") or []
-        # fallback to all
-        return tiles if tiles else [v for (v, _) in self.fields["enabled_tiles"].choices]
+        # fallback to all (copied, since it ends up on the Game instance)
+        return tiles if tiles else list(DEFAULT_TILES)
     
     def clean_board_length(self):
         """
         Validates board length constraints based on game mode.
         """
         mode = self.cleaned_data.get("mode") or Game.Mode.FINISH
-        bl = int(self.cleaned_data.get("board_length") or 35)
-
-        if mode in [Game.Mode.SURVIVAL, Game.Mode.DRAFT]:
+        if mode in _FIXED_BOARD_MODES:
             return 35  # force fixed length for these modes
 
+        # IntegerField has already coerced the value; only a missing one defaults
+        bl = self.cleaned_data.get("board_length")
+        if bl is None:
+            bl = 35
+
         # Finish Line: allow configurable size
         if bl < 20 or bl > 80:
             raise forms.ValidationError("Board length must be between 20 and 80.")
@@ -61,7 +79,11 @@ class GameCreateForm(forms.ModelForm):
         Validates max players constraints based on game mode.
         """
         mode = self.cleaned_data.get("mode") or Game.Mode.FINISH
-        max_players = int(self.cleaned_data.get("max_players") or 4)
+        max_players = self.cleaned_data.get("max_players")
+        if max_players is None:
+            max_players = 4
+        if max_players < 1:
+            raise forms.ValidationError("A game needs at least one player.")
         
         # Card Duel mode: enforce exactly 2 players
         if mode == Game.Mode.CARD_DUEL:
@@ -103,6 +125,9 @@ class JoinGameForm(forms.Form):
     def clean_code(self):
         """
         Normalizes the game code to uppercase and strips whitespace.
+        Rejects malformed codes before any game lookup is made.
         """
-        code = self.cleaned_data["code"].strip().upper()
+        code = self.cleaned_data["code"].translate(_CODE_TABLE)
+        if not _CODE_RE.fullmatch(code):
+            raise forms.ValidationError("Enter a valid game code.")
         return code
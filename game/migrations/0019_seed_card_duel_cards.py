@@ -0,0 +1,239 @@
+from django.db import migrations
+
+
+# Frozen copy of the card definitions at the time of this migration, so later
+# edits to game.card_duel_seed don't change what it writes.
+CARD_DUEL_CARDS = [
+    {
+        'code': 'BattleFocus',
+        'name': 'Battle Focus',
+        'description': 'Gain Battle Focus: +2 damage for 2 turns.',
+        'category': 'plus_status',
+        'effect_type': 'apply_status',
+        'params': {'status': {'type': 'battle_focus', 'turns': 2, 'damage_bonus': 2, 'stacks': 1}},
+    },
+    {
+        'code': 'IronSkin',
+        'name': 'Iron Skin',
+        'description': 'Gain 6 shield.',
+        'category': 'plus_status',
+        'effect_type': 'shield',
+        'params': {'amount': 6},
+    },
+    {
+        'code': 'PurifyAura',
+        'name': 'Purify Aura',
+        'description': 'Remove all negative effects from yourself.',
+        'category': 'plus_status',
+        'effect_type': 'cleanse',
+        'params': {'target': 'self', 'remove_count': 100, 'types': ['poison', 'burn', 'weaken', 'vulnerable', 'silence', 'stun', 'weaken_curse']},
+    },
+    {
+        'code': 'RegenBrew',
+        'name': 'Regen Brew',
+        'description': 'Gain Regen: heal 2 at the start of your next 2 turns.',
+        'category': 'plus_status',
+        'effect_type': 'apply_status',
+        'params': {'status': {'type': 'regen', 'turns': 2, 'tick_heal': 2, 'stacks': 1}},
+    },
+    {
+        'code': 'Heal',
+        'name': 'Heal',
+        'description': 'Restore 5 HP.',
+        'category': 'plus_status',
+        'effect_type': 'heal',
+        'params': {'amount': 5},
+    },
+    {
+        'code': 'Poison',
+        'name': 'Poison',
+        'description': 'Apply Poison: target takes 1 damage at the start of their next 3 turns.',
+        'category': 'minus_status',
+        'effect_type': 'apply_status',
+        'params': {'status': {'type': 'poison', 'turns': 3, 'tick_damage': 1, 'stacks': 1}},
+    },
+    {
+        'code': 'Burn',
+        'name': 'Burn',
+        'description': 'Apply Burn: target takes 2 damage at the start of their next 2 turns.',
+        'category': 'minus_status',
+        'effect_type': 'apply_status',
+        'params': {'status': {'type': 'burn', 'turns': 2, 'tick_damage': 2, 'stacks': 1}},
+    },
+    {
+        'code': 'Weaken',
+        'name': 'Weaken',
+        'description': 'Apply Weaken: target deals 2 less damage on their next attack card.',
+        'category': 'minus_status',
+        'effect_type': 'apply_status',
+        'params': {'status': {'type': 'weaken', 'turns': 1, 'damage_down_next': 2, 'stacks': 1}},
+    },
+    {
+        'code': 'Vulnerable',
+        'name': 'Vulnerable',
+        'description': 'Apply Vulnerable: target takes +1 damage for their next 2 turns.',
+        'category': 'minus_status',
+        'effect_type': 'apply_status',
+        'params': {'status': {'type': 'vulnerable', 'turns': 2, 'damage_taken_up': 1, 'stacks': 1}},
+    },
+    {
+        'code': 'Silence',
+        'name': 'Silence Seal',
+        'description': 'Apply Silence: target cannot play ANY card on their next turn.',
+        'category': 'minus_status',
+        'effect_type': 'apply_status',
+        'params': {'status': {'type': 'silence', 'turns': 1, 'block_all': True, 'stacks': 1}},
+    },
+    {
+        'code': 'Stun',
+        'name': 'Stun Shock',
+        'description': 'Apply Stun: target cannot play an Action card on their next turn (Bonus cards allowed).',
+        'category': 'minus_status',
+        'effect_type': 'apply_status',
+        'params': {'status': {'type': 'stun', 'turns': 1, 'block_action': True, 'stacks': 1}},
+    },
+    {
+        'code': 'Adrenaline',
+        'name': 'Adrenaline',
+        'description': 'Draw +1 card next turn.',
+        'category': 'neutral',
+        'effect_type': 'apply_status',
+        'params': {'status': {'type': 'focus', 'turns': 1, 'extra_draw': 1, 'stacks': 1}},
+    },
+    {
+        'code': 'CardCycle',
+        'name': 'Card Cycle',
+        'description': 'Change (replace) up to 2 cards in your hand.',
+        'category': 'neutral',
+        'effect_type': 'discard_and_draw',
+        'params': {'amount': 2},
+    },
+    {
+        'code': 'GuardSwap',
+        'name': 'Guard Swap',
+        'description': 'Swap shields between you and the enemy.',
+        'category': 'neutral',
+        'effect_type': 'swap_shield',
+        'params': {},
+    },
+    {
+        'code': 'QuickFix',
+        'name': 'Quick Fix',
+        'description': 'Heal 2 and gain 2 shield.',
+        'category': 'neutral',
+        'effect_type': 'heal_and_shield',
+        'params': {'heal': 2, 'shield': 2},
+    },
+    {
+        'code': 'WeakenCurse',
+        'name': 'Weaken Curse',
+        'description': 'Enemy deals 50% less damage (rounded down) on their next attack.',
+        'category': 'neutral',
+        'effect_type': 'apply_status',
+        'params': {'status': {'type': 'weaken_curse', 'turns': 1, 'damage_percent': 50, 'stacks': 1}},
+    },
+    {
+        'code': 'Amplify',
+        'name': 'Amplify',
+        'description': 'Your next heal restores +3 additional HP.',
+        'category': 'bonus',
+        'effect_type': 'apply_status',
+        'params': {'status': {'type': 'amplify_heal', 'turns': 99, 'heal_bonus': 3, 'stacks': 1, 'consume_on_heal': True}},
+    },
+    {
+        'code': 'AntidoteKit',
+        'name': 'Antidote Kit',
+        'description': 'Remove Poison and Burn effects, then heal 1 HP.',
+        'category': 'bonus',
+        'effect_type': 'antidote',
+        'params': {'heal': 1, 'types': ['poison', 'burn']},
+    },
+    {
+        'code': 'CounterStance',
+        'name': 'Counter Stance',
+        'description': 'Reflect 3 damage once (the next time you take damage).',
+        'category': 'bonus',
+        'effect_type': 'apply_status',
+        'params': {'status': {'type': 'counter_stance', 'turns': 99, 'reflect_amount': 3, 'stacks': 1, 'consume_on_hit': True}},
+    },
+    {
+        'code': 'GambleCoin',
+        'name': 'Gamble Coin',
+        'description': '50% chance to gain 8 shield, 50% chance to take 3 damage.',
+        'category': 'bonus',
+        'effect_type': 'gamble',
+        'params': {'win': {'type': 'shield', 'amount': 8}, 'loss': {'type': 'damage_self', 'amount': 3}, 'win_chance': 0.5},
+    },
+    {
+        'code': 'LuckyDraw',
+        'name': 'Lucky Draw',
+        'description': 'Draw 2 cards.',
+        'category': 'bonus',
+        'effect_type': 'draw',
+        'params': {'amount': 2},
+    },
+    {
+        'code': 'VenomStrike',
+        'name': 'Venom Strike',
+        'description': 'Deal 3 damage and apply Poison (1 dmg for 3 turns).',
+        'category': 'bonus',
+        'effect_type': 'damage',
+        'params': {'amount': 3, 'apply_status': {'type': 'poison', 'turns': 3, 'tick_damage': 1, 'stacks': 1}},
+    },
+    {
+        'code': 'FlameJab',
+        'name': 'Flame Jab',
+        'description': 'Deal 3 damage and apply Burn (2 dmg for 2 turns).',
+        'category': 'bonus',
+        'effect_type': 'damage',
+        'params': {'amount': 3, 'apply_status': {'type': 'burn', 'turns': 2, 'tick_damage': 2, 'stacks': 1}},
+    },
+    {
+        'code': 'HolyLight',
+        'name': 'Holy Light',
+        'description': 'Heal 3 and gain Regen (heal 1 for 3 turns).',
+        'category': 'bonus',
+        'effect_type': 'heal',
+        'params': {'amount': 3, 'apply_status': {'type': 'regen', 'turns': 3, 'tick_heal': 1, 'stacks': 1}},
+    },
+    {
+        'code': 'CripplingShot',
+        'name': 'Crippling Shot',
+        'description': 'Deal 4 damage and apply Weaken (-2 on next attack).',
+        'category': 'bonus',
+        'effect_type': 'damage',
+        'params': {'amount': 4, 'apply_status': {'type': 'weaken', 'turns': 1, 'damage_down_next': 2, 'stacks': 1}},
+    },
+]
+
+
+def seed_cards(apps, schema_editor):
+    CardDuelCardType = apps.get_model('game', 'CardDuelCardType')
+    CardDuelCardType.objects.bulk_create(
+        [
+            CardDuelCardType(
+                code=card['code'],
+                name=card['name'],
+                description=card['description'],
+                category=card['category'],
+                effect_type=card['effect_type'],
+                params=card['params'],
+                is_active=True,
+            )
+            for card in CARD_DUEL_CARDS
+        ],
+        update_conflicts=True,
+        unique_fields=['code'],
+        update_fields=['name', 'description', 'category', 'effect_type', 'params', 'is_active'],
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0018_remove_game_is_private_remove_game_password_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_cards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.17 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0019_seed_card_duel_cards'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cardduelcardtype',
+            index=models.Index(fields=['is_active', 'category', 'code'], name='cd_active_cat_code_idx'),
+        ),
+    ]
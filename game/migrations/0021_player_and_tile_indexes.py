@@ -0,0 +1,25 @@
+# Generated by Django 4.2.17 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0020_cardduelcardtype_cd_active_cat_code_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='playeringame',
+            index=models.Index(fields=['game', 'turn_order'], name='player_game_turn_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='playeringame',
+            index=models.Index(fields=['game', 'is_alive'], name='player_game_alive_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardtile',
+            index=models.Index(fields=['game', 'tile_type'], name='tile_game_type_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.17 on 2026-10-16 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0021_player_and_tile_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(condition=models.Q(('status', 'waiting')), fields=['-created_at'], name='game_waiting_created_idx'),
+        ),
+    ]
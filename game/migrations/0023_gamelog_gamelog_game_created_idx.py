@@ -0,0 +1,17 @@
+# Generated by Django 4.2.17 on 2026-10-16 14:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0022_game_game_waiting_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='gamelog',
+            index=models.Index(fields=['game', 'created_at'], name='gamelog_game_created_idx'),
+        ),
+    ]
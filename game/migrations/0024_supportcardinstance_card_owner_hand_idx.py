@@ -0,0 +1,17 @@
+# Generated by Django 4.2.17 on 2026-10-16 14:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0023_gamelog_gamelog_game_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='supportcardinstance',
+            index=models.Index(condition=models.Q(('used_at__isnull', True)), fields=['owner'], name='card_owner_hand_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.17 on 2026-10-16 15:30
+
+from django.db import migrations
+from django.utils import timezone
+
+
+def stamp_used_cards(apps, schema_editor):
+    SupportCardInstance = apps.get_model('game', 'SupportCardInstance')
+    SupportCardInstance.objects.filter(is_used=True, used_at__isnull=True).update(used_at=timezone.now())
+
+
+def restore_is_used(apps, schema_editor):
+    SupportCardInstance = apps.get_model('game', 'SupportCardInstance')
+    SupportCardInstance.objects.filter(used_at__isnull=False).update(is_used=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0024_supportcardinstance_card_owner_hand_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(stamp_used_cards, restore_is_used),
+        migrations.RemoveField(
+            model_name='supportcardinstance',
+            name='is_used',
+        ),
+    ]
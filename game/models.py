@@ -1,12 +1,17 @@
 import random as _r
+from collections import deque
+from itertools import accumulate
+from operator import attrgetter
 
 from django.db import models, transaction
+from django.utils.functional import cached_property
 from django.contrib.auth import get_user_model
-from django.db.models import Max
+from django.core.cache import cache
+from django.db.models import Count, F, Max, Q
 from .questions import generate_math_question
 
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 User = get_user_model()
@@ -50,6 +55,67 @@ def save_user_profile(sender, instance, **kwargs):
     instance.profile.save()
 
 
+# Player columns read by Game.to_public_state(); the Card Duel JSON columns are skipped.
+_PUBLIC_STATE_PLAYER_FIELDS = (
+    "id", "game", "user", "turn_order", "hp", "coins", "position", "is_alive",
+    "shield_points", "extra_rolls", "draft_picks", "draft_options",
+    "user__username", "user__profile__profile_picture",
+)
+
+
+# Compact separators for encoded state payloads (no padding spaces on the wire)
+PUBLIC_STATE_JSON_SEPARATORS = (",", ":")
+
+# Row readers for the to_public_state() payload loops
+_PLAYER_PAYLOAD_FIELDS = attrgetter("id", "user_id", "turn_order", "hp", "coins", "position", "is_alive")
+_TILE_PAYLOAD_FIELDS = attrgetter("id", "position", "tile_type", "label", "value_int", "config")
+
+
+class GameQuerySet(models.QuerySet):
+    """
+    Custom queryset for Game with helpers for loading related state in bulk.
+    """
+    def with_public_state_prefetch(self, for_user=None):
+        """
+        Prefetches the rows Game.to_public_state() reads per game: players
+        (with their users, in turn order) and, when `for_user` is given, that
+        user's unused support cards (with card types), the only hand the
+        state exposes. Tiles are not prefetched; to_public_state() serves them
+        from the board cache once the game has started.
+
+        Args:
+            for_user (User, optional): The user the state will be built for.
+        """
+        lookups = [
+            models.Prefetch(
+                "players",
+                queryset=PlayerInGame.objects.select_related("user__profile")
+                .only(*_PUBLIC_STATE_PLAYER_FIELDS)
+                .order_by("turn_order"),
+            ),
+        ]
+        if for_user is not None and for_user.is_authenticated:
+            # Unused cards go to player.hand (empty for everyone but the viewer),
+            # so player.cards.all() still means every card
+            lookups.append(
+                models.Prefetch(
+                    "players__cards",
+                    queryset=SupportCardInstance.objects.filter(
+                        owner__user_id=for_user.pk, used_at__isnull=True
+                    ).select_related("card_type"),
+                    to_attr="hand",
+                )
+            )
+        return self.prefetch_related(*lookups)
+
+    def with_tile_bounds(self):
+        """
+        Annotates each game with its highest tile position, so that
+        Game.last_tile_index() needs no per-game aggregate query.
+        """
+        return self.annotate(_max_tile_pos=Max("tiles__position"))
+
+
 class Game(models.Model):
     """
     Main Game model representing a single game session.
@@ -125,6 +191,17 @@ class Game(models.Model):
 
     ordering_state = models.JSONField(null=True, blank=True)
 
+    objects = GameQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Lobby list: waiting games, newest first (partial, so it stays small)
+            models.Index(
+                fields=["-created_at"],
+                name="game_waiting_created_idx",
+                condition=Q(status="waiting"),
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Game {self.code} ({self.get_status_display()})"
@@ -134,6 +211,22 @@ class Game(models.Model):
         """Returns True if the game status is active."""
         return self.status == self.Status.ACTIVE
 
+    @property
+    def board_cache_key(self) -> str:
+        """
+        Cache key of this game's serialized board tiles (see to_public_state).
+        Includes created_at so a reused primary key never hits another game's board.
+        """
+        return f"board:{self.pk}:{self.created_at.timestamp()}"
+
+    @cached_property
+    def tiles_by_position(self) -> dict:
+        """
+        Returns this game's tiles keyed by position, loaded once per instance.
+        Tiles don't change after board generation; generate_random_board() resets it.
+        """
+        return {t.position: t for t in self.tiles.all()}
+
     @property
     def players_by_turn_order(self):
         """
@@ -141,19 +234,23 @@ class Game(models.Model):
         """
         return self.players.order_by("turn_order")
 
-    def sync_turn_to_alive_player(self) -> bool:
+    def sync_turn_to_alive_player(self, players=None) -> bool:
         """
         Ensures `current_turn_index` points to an alive player.
         Fixes cases where a player is eliminated out of turn, but turn index implies it's their turn.
         Does not override pending modal locks (question, shop, etc.).
 
+        Args:
+            players (list[PlayerInGame], optional): Players in turn order, if already loaded.
+
         Returns:
             bool: True if the turn index was updated, False otherwise.
         """
         if self.pending_question or self.pending_shop or self.pending_duel or self.pending_gun:
             return False
 
-        players = list(self.players_by_turn_order)
+        if players is None:
+            players = list(self.players_by_turn_order)
         if not players:
             return False
 
@@ -180,10 +277,19 @@ class Game(models.Model):
         """
         Returns the PlayerInGame instance currently holding the turn.
         Ensures the turn is held by an alive player.
+
+        Only the columns needed to resolve the turn are loaded (one narrow query);
+        other fields are fetched on access.
         """
-        self.sync_turn_to_alive_player()
+        players = list(self.players_by_turn_order.only("id", "game", "user", "turn_order", "is_alive"))
+        return self._current_player_from(players)
 
-        players = list(self.players_by_turn_order)
+    def _current_player_from(self, players):
+        """
+        Resolves the current player from an already-loaded list of players in turn order.
+        Ensures the turn is held by an alive player.
+        """
+        self.sync_turn_to_alive_player(players)
         if not players:
             return None
 
@@ -230,12 +336,15 @@ class Game(models.Model):
             player.coins = int(player.coins or 0) + laps * 2
 
         player.position = to_pos
-        player.save(update_fields=["position", "hp", "coins"])
+        moved_fields = ("position", "hp", "coins")
 
-        landed_tile = self.tiles.filter(position=to_pos).first()
+        landed_tile = self.tiles_by_position.get(to_pos)
         tile_effect = None
         if landed_tile:
-            tile_effect = self.execute_tile_effect(player, landed_tile)
+            # The move is written together with the tile effect's own changes
+            tile_effect = self.execute_tile_effect(player, landed_tile, unsaved_fields=moved_fields)
+        else:
+            player.save(update_fields=list(moved_fields))
 
         self.check_elimination_winner()
 
@@ -286,11 +395,14 @@ class Game(models.Model):
     # Turn Synchronization Helpers
     # ---------------------------
 
-    def sync_turn_to_pending_question(self) -> bool:
+    def sync_turn_to_pending_question(self, players=None) -> bool:
         """
         If there is a pending question, ensure current_turn_index points to
         the player who must answer it.
         
+        Args:
+            players (list[PlayerInGame], optional): Players in turn order, if already loaded.
+
         Returns:
             bool: True if the turn index changed.
         """
@@ -302,7 +414,8 @@ class Game(models.Model):
         if not pid:
             return False
 
-        players = list(self.players_by_turn_order)
+        if players is None:
+            players = list(self.players_by_turn_order)
         if not players:
             return False
 
@@ -316,11 +429,14 @@ class Game(models.Model):
 
         return False
     
-    def sync_turn_to_pending_shop(self) -> bool:
+    def sync_turn_to_pending_shop(self, players=None) -> bool:
         """
         If there is a pending shop, ensure current_turn_index points to
         the player who must close it.
         
+        Args:
+            players (list[PlayerInGame], optional): Players in turn order, if already loaded.
+
         Returns:
             bool: True if the turn index changed.
         """
@@ -332,7 +448,8 @@ class Game(models.Model):
         if not pid:
             return False
 
-        players = list(self.players_by_turn_order)
+        if players is None:
+            players = list(self.players_by_turn_order)
         if not players:
             return False
 
@@ -346,11 +463,14 @@ class Game(models.Model):
 
         return False
     
-    def sync_turn_to_pending_gun(self) -> bool:
+    def sync_turn_to_pending_gun(self, players=None) -> bool:
         """
         If there is a pending gun action, ensure current_turn_index points to
         the player who must resolve it.
         
+        Args:
+            players (list[PlayerInGame], optional): Players in turn order, if already loaded.
+
         Returns:
             bool: True if the turn index changed.
         """
@@ -362,7 +482,8 @@ class Game(models.Model):
         if not pid:
             return False
 
-        players = list(self.players_by_turn_order)
+        if players is None:
+            players = list(self.players_by_turn_order)
         for idx, p in enumerate(players):
             if p.id == pid:
                 if self.current_turn_index != idx:
@@ -373,11 +494,14 @@ class Game(models.Model):
         return False
 
 
-    def sync_turn_to_pending_duel(self) -> bool:
+    def sync_turn_to_pending_duel(self, players=None) -> bool:
         """
         If there is a pending duel, ensure current_turn_index points to
         the initiator or relevant player.
 
+        Args:
+            players (list[PlayerInGame], optional): Players in turn order, if already loaded.
+
         Returns:
             bool: True if the turn index changed.
         """
@@ -389,7 +513,8 @@ class Game(models.Model):
         if not initiator_id:
             return False
 
-        players = list(self.players_by_turn_order)
+        if players is None:
+            players = list(self.players_by_turn_order)
         for idx, p in enumerate(players):
             if p.id == initiator_id:
                 if self.current_turn_index != idx:
@@ -400,7 +525,7 @@ class Game(models.Model):
         return False
 
 
-    def to_public_state(self, for_user=None, viewer=None):
+    def to_public_state(self, for_user=None, viewer=None, *, players=None):
         """
         Returns a JSON-serializable dictionary representation of the game state.
         This is the primary payload sent to the frontend.
@@ -408,27 +533,38 @@ class Game(models.Model):
         Args:
             for_user (User): The user requesting the state (used to determine 'is_you').
             viewer: Optional viewer context.
+            players (list[PlayerInGame], optional): This game's players in turn order, if the
+                caller already loaded them (with their users and profiles).
 
         Returns:
             dict: The public game state.
         """
-        UserModel = get_user_model()
+        # Players list (fetched once; reused for turn syncing, the current player and gun targets).
+        # Use the caller's list, or the prefetched rows when loaded via
+        # Game.objects.with_public_state_prefetch().
+        prefetched = getattr(self, "_prefetched_objects_cache", {})
+        if players is not None:
+            players_list = list(players)
+        elif "players" in prefetched:
+            players_list = list(self.players.all())
+        else:
+            players_list = list(
+                self.players.select_related("user__profile")
+                .only(*_PUBLIC_STATE_PLAYER_FIELDS)
+                .order_by("turn_order")
+            )
 
         # Ensure consistency: if action is pending, lock turn to that player
-        self.sync_turn_to_pending_question()
-        self.sync_turn_to_pending_shop()
-        self.sync_turn_to_pending_duel()
-        self.sync_turn_to_pending_gun()
-
-        # Players list
-        players_qs = self.players.select_related("user").order_by("turn_order")
-        players_list = list(players_qs)
+        self.sync_turn_to_pending_question(players_list)
+        self.sync_turn_to_pending_shop(players_list)
+        self.sync_turn_to_pending_duel(players_list)
+        self.sync_turn_to_pending_gun(players_list)
 
-        current = self.current_player
+        current = self._current_player_from(players_list)
 
         # Determine `me` (PlayerInGame for the requesting user) early
         me = None
-        if for_user is not None and isinstance(for_user, UserModel):
+        if for_user is not None and isinstance(for_user, User):
             for p in players_list:
                 if p.user_id == for_user.id:
                     me = p
@@ -469,9 +605,7 @@ class Game(models.Model):
         if self.pending_gun:
             gun_for_player_id = self.pending_gun.get("for_player_id")
             if me is not None and gun_for_player_id == me.id:
-                targets = list(
-                    self.players.filter(is_alive=True).exclude(id=me.id).select_related("user")
-                )
+                targets = [p for p in players_list if p.is_alive and p.id != me.id]
                 gun_payload = {
                     "damage": int(self.pending_gun.get("damage", 2) or 2),
                     "tile_position": self.pending_gun.get("tile_position"),
@@ -479,6 +613,9 @@ class Game(models.Model):
                 }
 
 
+        me_id = me.id if me is not None else None
+        current_id = current.id if current is not None else None
+
         players_payload = []
         for p in players_list:
             # Safely get profile picture URL
@@ -489,36 +626,45 @@ class Game(models.Model):
             except Exception:
                 pass
 
+            pid, user_id, turn_order, hp, coins, position, is_alive = _PLAYER_PAYLOAD_FIELDS(p)
             players_payload.append(
                 {
-                    "id": p.id,
-                    "user_id": p.user_id,
+                    "id": pid,
+                    "user_id": user_id,
                     "username": p.user.username,
                     "profile_picture_url": prof_pic,
-                    "turn_order": p.turn_order,
-                    "hp": p.hp,
-                    "coins": p.coins,
-                    "position": p.position,
-                    "is_alive": p.is_alive,
-                    "is_you": (me is not None and p.id == me.id),
-                    "is_current_turn": (current is not None and p.id == current.id),
+                    "turn_order": turn_order,
+                    "hp": hp,
+                    "coins": coins,
+                    "position": position,
+                    "is_alive": is_alive,
+                    "is_you": pid == me_id,
+                    "is_current_turn": pid == current_id,
                 }
             )
 
-        # Board tiles
-        tiles_payload = []
-        for tile in self.tiles.order_by("position"):
-            tiles_payload.append(
-                {
-                    "id": tile.id,
-                    "position": tile.position,
-                    "type": tile.tile_type,
-                    "type_display": tile.get_tile_type_display(),
-                    "label": tile.label,
-                    "value_int": tile.value_int,
-                    "config": tile.config or {},
-                }
-            )
+        # Board tiles. The board is built once when the game starts and never changes after,
+        # so past the lobby the serialized list is cached (no TTL) instead of re-queried per poll.
+        board_cacheable = self.status != self.Status.WAITING
+        tiles_payload = cache.get(self.board_cache_key) if board_cacheable else None
+        if tiles_payload is None:
+            tiles_payload = []
+            tiles = self.tiles.all() if "tiles" in prefetched else self.tiles.order_by("position")
+            for tile in tiles:
+                tid, position, tile_type, label, value_int, config = _TILE_PAYLOAD_FIELDS(tile)
+                tiles_payload.append(
+                    {
+                        "id": tid,
+                        "position": position,
+                        "type": tile_type,
+                        "type_display": _TILE_TYPE_DISPLAY.get(tile_type, tile_type),
+                        "label": label,
+                        "value_int": value_int,
+                        "config": config or {},
+                    }
+                )
+            if board_cacheable and tiles_payload:
+                cache.set(self.board_cache_key, tiles_payload, None)
 
         payload = {
             "id": self.id,
@@ -595,6 +741,10 @@ class Game(models.Model):
 
         # --- Support cards inventory ---
         if me is not None:
+            # Unused cards only; served from the prefetched `hand` list when present
+            hand = getattr(me, "hand", None)
+            if hand is None:
+                hand = me.cards.filter(used_at__isnull=True).select_related("card_type")
             payload["your_cards"] = [
                 {
                     "id": c.id,
@@ -605,8 +755,7 @@ class Game(models.Model):
                     "params": c.card_type.params or {},
                     "is_used": c.is_used,
                 }
-                for c in me.cards.select_related("card_type").all()
-                if not c.is_used
+                for c in hand
             ]
             payload["you_shield_points"] = getattr(me, "shield_points", 0)
             payload["you_extra_rolls"] = getattr(me, "extra_rolls", 0)
@@ -640,14 +789,25 @@ class Game(models.Model):
         return payload
 
     def last_tile_index(self) -> int:
-        """Returns the position index of the last tile on the board."""
-        max_pos = self.tiles.aggregate(max_pos=Max("position"))["max_pos"]
+        """
+        Returns the position index of the last tile on the board.
+        Boards are generated with exactly `board_length` tiles, so no query is
+        needed unless board_length is unset (legacy rows).
+        """
+        cached = getattr(self, "_last_tile_index", None)
+        if cached is not None:
+            return cached
+
+        # Loaded via Game.objects.with_tile_bounds()
+        max_pos = getattr(self, "_max_tile_pos", None)
+        if max_pos is None and self.board_length and self.board_length > 0:
+            max_pos = self.board_length - 1
+        if max_pos is None:
+            max_pos = self.tiles.aggregate(max_pos=Max("position"))["max_pos"]
         if max_pos is not None:
+            self._last_tile_index = max_pos
             return max_pos
 
-        if self.board_length and self.board_length > 0:
-            return self.board_length - 1
-
         return 0
 
     def get_player_for_user(self, user):
@@ -671,40 +831,48 @@ class Game(models.Model):
         raw_target = from_pos + dice_value
         to_pos = min(raw_target, last_index)
 
-        # Initial move
+        # Initial move (saved below, together with any finish rank)
         player.position = to_pos
-        player.save(update_fields=["position"])
 
-        landed_tile = self.tiles.filter(position=to_pos).first()
+        landed_tile = self.tiles_by_position.get(to_pos)
 
         won = False
         tile_effect = None
 
         if landed_tile and landed_tile.tile_type == BoardTile.TileType.FINISH:
+            # Count finished and total players in one query
+            counts = self.players.aggregate(
+                total=Count("id"),
+                finished=Count("id", filter=Q(finish_rank__isnull=False)),
+            )
+            finished_count = counts["finished"]
+
             # Assign finish rank to this player
-            # Count how many players have already finished
-            finished_count = self.players.filter(finish_rank__isnull=False).count()
             player.finish_rank = finished_count + 1
-            player.save(update_fields=["finish_rank"])
+            player.save(update_fields=["position", "finish_rank"])
             
             # Check if enough players have finished to end the game
-            total_players = self.players.count()
-            required_finishers = total_players - 1  # All but one player must finish
+            required_finishers = counts["total"] - 1  # All but one player must finish
             
             if finished_count + 1 >= required_finishers:
                 # Game ends
                 self.status = Game.Status.FINISHED
                 # Winner is the player with finish_rank = 1
-                winner = self.players.filter(finish_rank=1).first()
+                if player.finish_rank == 1:
+                    winner = player
+                else:
+                    winner = self.players.filter(finish_rank=1).first()
                 self.winner = winner
                 self.save(update_fields=["status", "winner"])
                 won = True
             else:
                 # Game continues, but this player has finished
                 won = False
+        elif landed_tile:
+            # The move is written together with the tile effect's own changes
+            tile_effect = self.execute_tile_effect(player, landed_tile, unsaved_fields=("position",))
         else:
-            if landed_tile:
-                tile_effect = self.execute_tile_effect(player, landed_tile)
+            player.save(update_fields=["position"])
 
         return {
             "from_position": from_pos,
@@ -716,23 +884,35 @@ class Game(models.Model):
             "tile_effect": tile_effect,
         }
 
-    def execute_tile_effect(self, player, tile, *, ctx=None):
+    def execute_tile_effect(self, player, tile, *, ctx=None, unsaved_fields=()):
         """
         Executes the effect of a tile when a player lands on it.
+        The player's changed fields are written with a single save at the end.
 
         Args:
             player (PlayerInGame): The player triggering the tile.
             tile (BoardTile): The tile landed on.
             ctx (dict, optional): Context for complex chain effects (e.g. Mass Warp).
+            unsaved_fields (Iterable[str], optional): Fields already changed on the
+                player (e.g. by the move) to write in the same save.
 
         Returns:
             dict: Description of effects applied (hp_delta, position_delta, extra data).
         """
+        dirty = set(unsaved_fields)
+        effects = self._apply_tile_effect(player, tile, {} if ctx is None else ctx, dirty)
+        if dirty:
+            player.save(update_fields=sorted(dirty))
+        return effects
+
+    def _apply_tile_effect(self, player, tile, ctx, dirty):
+        """
+        Applies a tile's effect for execute_tile_effect(), recording changed
+        player fields in `dirty` instead of saving each one.
+        """
         t = tile.tile_type
         value = tile.value_int
         cfg = tile.config or {}
-        if ctx is None:
-            ctx = {}
 
         effects = {
             "tile_type": t,
@@ -767,7 +947,7 @@ class Game(models.Model):
                 hp_delta = -hp_delta
 
             damage = abs(int(hp_delta))
-            self.apply_damage(player, damage, effects, source="trap")
+            self.apply_damage(player, damage, effects, source="trap", dirty=dirty)
             return effects
         
         # ---------- HEAL ----------
@@ -779,12 +959,12 @@ class Game(models.Model):
             player.hp += hp_delta
             effects["hp_delta"] = hp_delta
 
-            player.save(update_fields=["hp"])
+            dirty.add("hp")
             return effects
 
         # ---------- BONUS ----------
         if t == BoardTile.TileType.BONUS:
-            active_types = list(SupportCardType.objects.filter(is_active=True))
+            active_types = active_support_card_types()
             if not active_types:
                 effects["extra"]["no_cards_available"] = True
                 return effects
@@ -831,7 +1011,7 @@ class Game(models.Model):
         if t == BoardTile.TileType.WARP:
             board_size = int(effects["extra"].get("board_size") or 0)
             if not board_size:
-                board_size = self.tiles.count() if hasattr(self, "tiles") else 50
+                board_size = self.board_length or (self.last_tile_index() + 1)
 
             distance = _r.randint(1, 3)
             direction = _r.choice([-1, 1])
@@ -840,7 +1020,7 @@ class Game(models.Model):
             new_pos = (start_pos + delta) % board_size
 
             player.position = new_pos
-            player.save(update_fields=["position"])
+            dirty.add("position")
 
             effects["position_delta"] = delta
             effects["position_set"] = new_pos
@@ -865,35 +1045,40 @@ class Game(models.Model):
 
             ctx["mass_warp_fired"] = True
 
-            alive_players = list(self.players.filter(is_alive=True).order_by("id"))
-            if len(alive_players) < 2:
-                effects["extra"]["mass_warp"] = {"moved": [], "note": "Not enough alive players to swap."}
-                effects["position_delta"] = 0
-                effects["position_set"] = player.position
-                return effects
-
-            old_positions = [p.position for p in alive_players]
-            new_positions = old_positions[:]
-            for _ in range(10):
-                _r.shuffle(new_positions)
-                if any(a != b for a, b in zip(old_positions, new_positions)):
-                    break
+            # Positions are re-read below, so write this player's pending move first
+            if dirty:
+                player.save(update_fields=sorted(dirty))
+                dirty.clear()
 
-            moved = []
             with transaction.atomic():
+                # Lock the rows being rewritten (id order, so concurrent warps can't deadlock)
+                alive_players = list(self.players.select_for_update().filter(is_alive=True).order_by("id"))
+                if len(alive_players) < 2:
+                    effects["extra"]["mass_warp"] = {"moved": [], "note": "Not enough alive players to swap."}
+                    effects["position_delta"] = 0
+                    effects["position_set"] = player.position
+                    return effects
+
+                old_positions = [p.position for p in alive_players]
+                # Rotate by a random non-zero offset: never the identity permutation for n >= 2
+                k = _r.randrange(1, len(old_positions))
+                new_positions = old_positions[k:] + old_positions[:k]
+
+                moved = []
                 for p, old_pos, new_pos in zip(alive_players, old_positions, new_positions):
                     p.position = new_pos
                     moved.append({"player_id": p.id, "from": old_pos, "to": new_pos, "delta": new_pos - old_pos})
-                type(alive_players[0]).objects.bulk_update(alive_players, ["position"])
+                # One UPDATE for all players
+                PlayerInGame.objects.bulk_update(alive_players, ["position"])
 
             retriggered = []
-            queue = alive_players[:]
+            queue = deque(alive_players)
             max_triggers = ctx.get("max_triggers", 50)
             triggers_used = 0
 
             while queue and triggers_used < max_triggers:
-                p = queue.pop(0)
-                landed_tile = self.tiles.filter(position=p.position).first()
+                p = queue.popleft()
+                landed_tile = self.tiles_by_position.get(p.position)
                 if not landed_tile:
                     continue
 
@@ -965,7 +1150,7 @@ class Game(models.Model):
                 # Offer size by level
                 offer_count = {1: 3, 2: 4, 3: 5}.get(shop_level, 3)
 
-                active_types = list(SupportCardType.objects.filter(is_active=True))
+                active_types = active_support_card_types()
                 if active_types:
                     picked = _r.sample(active_types, k=min(offer_count, len(active_types)))
                 else:
@@ -1056,7 +1241,15 @@ class Game(models.Model):
 
         return max(1, int(base))
 
-    def apply_damage(self, player, damage: int, effects: dict | None = None, *, source: str | None = None):
+    def apply_damage(
+        self,
+        player,
+        damage: int,
+        effects: dict | None = None,
+        *,
+        source: str | None = None,
+        dirty: set | None = None,
+    ):
         """
         Applies damage to a player, handling shield absorption and death checks.
 
@@ -1065,13 +1258,46 @@ class Game(models.Model):
             damage (int): The amount of damage.
             effects (dict, optional): Effects dict to update with damage details.
             source (str, optional): The source of damage (e.g., "trap").
+            dirty (set, optional): If given, changed fields are added to it for the
+                caller to save, unless the player died (then they are saved now).
 
         Returns:
             dict: Summary of damage applied (blocked, taken, died).
         """
+        result, update_fields = self._apply_damage_in_memory(player, damage, effects, source=source)
+
+        if update_fields:
+            if dirty is None:
+                player.save(update_fields=update_fields)
+            else:
+                dirty.update(update_fields)
+            if player.hp == 0:
+                # The elimination check reads is_alive from the database
+                if dirty:
+                    player.save(update_fields=sorted(dirty))
+                    dirty.clear()
+                self.check_elimination_winner()
+
+        return result
+
+    @staticmethod
+    def _apply_damage_in_memory(player, damage: int, effects: dict | None = None, *, source: str | None = None):
+        """
+        Applies damage to a player's in-memory fields only (shield first, then HP).
+        Nothing is saved and no winner check runs; see apply_damage().
+
+        Args:
+            player (PlayerInGame): The player taking damage.
+            damage (int): The amount of damage.
+            effects (dict, optional): Effects dict to update with damage details.
+            source (str, optional): The source of damage (e.g., "trap").
+
+        Returns:
+            tuple: (summary dict of blocked/taken/died, sorted list of changed field names)
+        """
         dmg = max(0, int(damage or 0))
         if dmg == 0:
-            return {"blocked": 0, "taken": 0, "died": False}
+            return {"blocked": 0, "taken": 0, "died": False}, []
 
         shield = int(getattr(player, "shield_points", 0) or 0)
         blocked = min(shield, dmg)
@@ -1090,11 +1316,6 @@ class Game(models.Model):
                 player.is_alive = False
                 update_fields.append("is_alive")
 
-        if update_fields:
-            player.save(update_fields=sorted(set(update_fields)))
-            if player.hp == 0:
-                self.check_elimination_winner()
-
         if effects is not None:
             effects["hp_delta"] = effects.get("hp_delta", 0) - taken
             extra = effects.setdefault("extra", {})
@@ -1103,22 +1324,19 @@ class Game(models.Model):
             if source:
                 extra["damage_source"] = source
 
-        return {"blocked": blocked, "taken": taken, "died": (taken > 0 and player.hp == 0)}
+        died = taken > 0 and player.hp == 0
+        return {"blocked": blocked, "taken": taken, "died": died}, sorted(update_fields)
 
     def build_leaderboard(self):
         """Builds a leaderboard list for the game end."""
-        players_qs = self.players.select_related("user").all()
-
-        ranked = sorted(
-            players_qs,
-            key=lambda p: (
-                # Players with finish_rank come first, sorted by rank (ascending)
-                # Players without finish_rank come after, sorted by position/coins/HP (descending)
-                (p.finish_rank is None, p.finish_rank or 999),
-                -int(p.position or 0),
-                -int(p.coins or 0),
-                -int(p.hp or 0),
-            ),
+        # Players with finish_rank come first, sorted by rank (ascending)
+        # Players without finish_rank come after, sorted by position/coins/HP (descending)
+        ranked = self.players.select_related("user").order_by(
+            F("finish_rank").asc(nulls_last=True),
+            "-position",
+            "-coins",
+            "-hp",
+            "turn_order",
         )
 
         leaderboard = []
@@ -1147,13 +1365,21 @@ class Game(models.Model):
 
         return leaderboard
 
-    def advance_turn(self):
+    def advance_turn(self, players=None, *, unsaved_fields=()):
         """
         Advances the turn to the next alive player.
         Checks for game end conditions if no alive players remain.
+
+        Args:
+            players (list[PlayerInGame], optional): Players in turn order, if already loaded.
+            unsaved_fields (iterable[str]): Game fields the caller changed but hasn't saved;
+                they are written in the same UPDATE as the turn change.
         """
-        players = list(self.players_by_turn_order)
+        if players is None:
+            players = list(self.players_by_turn_order)
         if not players:
+            if unsaved_fields:
+                self.save(update_fields=list(unsaved_fields))
             return None
 
         n = len(players)
@@ -1164,11 +1390,11 @@ class Game(models.Model):
             candidate = players[idx]
             if candidate.is_alive:
                 self.current_turn_index = idx
-                self.save(update_fields=["current_turn_index"])
+                self.save(update_fields=["current_turn_index", *unsaved_fields])
                 return candidate
 
         self.status = Game.Status.FINISHED
-        self.save(update_fields=["status"])
+        self.save(update_fields=["status", *unsaved_fields])
         return None
 
     def roll_and_apply_for(self, player):
@@ -1184,33 +1410,38 @@ class Game(models.Model):
         """
         dice = _r.randint(1, 6)
 
-        if self.mode == self.Mode.SURVIVAL:
-            move_result = self.apply_survival_move(player, dice_value=dice)
-        else:
-            move_result = self.apply_basic_move(player, dice_value=dice)
+        with transaction.atomic():
+            if self.mode == self.Mode.SURVIVAL:
+                move_result = self.apply_survival_move(player, dice_value=dice)
+            else:
+                move_result = self.apply_basic_move(player, dice_value=dice)
 
-        # If a question is pending, hard-lock turn to that player
-        if self.pending_question:
-            self.sync_turn_to_pending_question()
+            # Players in turn order, loaded once after the move (so eliminations are seen)
+            # and shared by the turn syncs, advance_turn() and the next-player lookup.
+            players = list(self.players_by_turn_order.only("id", "game", "user", "turn_order", "is_alive"))
 
-        if self.pending_shop:
-            self.sync_turn_to_pending_shop()
+            # If a question is pending, hard-lock turn to that player
+            if self.pending_question:
+                self.sync_turn_to_pending_question(players)
 
-        if self.pending_duel:
-            self.sync_turn_to_pending_duel()
+            if self.pending_shop:
+                self.sync_turn_to_pending_shop(players)
 
-        if self.pending_gun:
-            self.sync_turn_to_pending_gun()
+            if self.pending_duel:
+                self.sync_turn_to_pending_duel(players)
 
-        # If player did not win, go to next player's turn
-        if not move_result["won"] and not self.pending_question and not self.pending_shop and not self.pending_duel and not self.pending_gun:
-            if getattr(player, "extra_rolls", 0) > 0:
-                player.extra_rolls -= 1
-                player.save(update_fields=["extra_rolls"])
-            else:
-                self.advance_turn()
+            if self.pending_gun:
+                self.sync_turn_to_pending_gun(players)
+
+            # If player did not win, go to next player's turn
+            if not move_result["won"] and not self.pending_question and not self.pending_shop and not self.pending_duel and not self.pending_gun:
+                if getattr(player, "extra_rolls", 0) > 0:
+                    player.extra_rolls -= 1
+                    player.save(update_fields=["extra_rolls"])
+                else:
+                    self.advance_turn(players)
 
-        next_player = self.current_player
+            next_player = self._current_player_from(players)
 
         return {
             "dice": dice,
@@ -1233,19 +1464,20 @@ class Game(models.Model):
             self.board_length = length
             self.save(update_fields=["board_length"])
 
-        self.tiles.all().delete()
-
         TileModel = self.tiles.model
         TT = BoardTile.TileType
 
-        TileModel.objects.create(
-            game=self,
-            position=0,
-            tile_type=TT.START,
-            label="Start",
-            value_int=None,
-            config={},
-        )
+        # Build every tile in memory; they are written in one INSERT below.
+        tiles_to_create = [
+            TileModel(
+                game=self,
+                position=0,
+                tile_type=TT.START,
+                label="Start",
+                value_int=None,
+                config={},
+            )
+        ]
 
         middle_positions = range(1, length - 1)
 
@@ -1256,7 +1488,7 @@ class Game(models.Model):
         
         selected = [
             t for t in (self.enabled_tiles or [])
-            if t not in (TT.START, TT.FINISH) and t in dict(TT.choices)
+            if t not in (TT.START, TT.FINISH) and t in _VALID_TILE_TYPES
         ]
         
         if self.mode == self.Mode.DRAFT:
@@ -1280,10 +1512,12 @@ class Game(models.Model):
             TT.DUEL: 1,
             TT.SHOP: 1,
         }
-        tile_type_weights = [default_weights.get(t, 1) for t in tile_type_pool]
+        tile_type_cum_weights = list(accumulate(default_weights.get(t, 1) for t in tile_type_pool))
 
-        for pos in middle_positions:
-            t = _r.choices(tile_type_pool, weights=tile_type_weights, k=1)[0]
+        # Draw every middle tile type in one call (cumulative weights passed in, not rebuilt)
+        picks = _r.choices(tile_type_pool, cum_weights=tile_type_cum_weights, k=len(middle_positions))
+
+        for pos, t in zip(middle_positions, picks):
 
             label = ""
             value_int = None
@@ -1334,24 +1568,36 @@ class Game(models.Model):
                 value_int = None
                 config = {"shop_level": _r.randint(1, 3)}
 
-            TileModel.objects.create(
-                game=self,
-                position=pos,
-                tile_type=t,
-                label=label,
-                value_int=value_int,
-                config=config,
+            tiles_to_create.append(
+                TileModel(
+                    game=self,
+                    position=pos,
+                    tile_type=t,
+                    label=label,
+                    value_int=value_int,
+                    config=config,
+                )
             )
 
-        TileModel.objects.create(
-            game=self,
-            position=length - 1,
-            tile_type=TT.FINISH,
-            label="Finish",
-            value_int=None,
-            config={},
+        tiles_to_create.append(
+            TileModel(
+                game=self,
+                position=length - 1,
+                tile_type=TT.FINISH,
+                label="Finish",
+                value_int=None,
+                config={},
+            )
         )
 
+        # Replace the old board atomically so readers never see a partial one
+        with transaction.atomic():
+            self.tiles.all().delete()
+            TileModel.objects.bulk_create(tiles_to_create)
+        self._last_tile_index = length - 1
+        self.__dict__.pop("tiles_by_position", None)
+        cache.delete(self.board_cache_key)
+
 
 class PlayerInGame(models.Model):
     """
@@ -1421,6 +1667,10 @@ class PlayerInGame(models.Model):
     class Meta:
         unique_together = ("game", "user")
         ordering = ["game", "turn_order"]
+        indexes = [
+            models.Index(fields=["game", "turn_order"], name="player_game_turn_idx"),
+            models.Index(fields=["game", "is_alive"], name="player_game_alive_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.user} in {self.game} (HP={self.hp}, pos={self.position})"
@@ -1519,11 +1769,21 @@ class BoardTile(models.Model):
     class Meta:
         unique_together = ("game", "position")
         ordering = ["game", "position"]
+        indexes = [
+            models.Index(fields=["game", "tile_type"], name="tile_game_type_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"Tile {self.position} ({self.get_tile_type_display()}) in {self.game.code}"
 
 
+# Tile type -> display label, used when serializing whole boards
+_TILE_TYPE_DISPLAY = dict(BoardTile.TileType.choices)
+
+# Valid tile type values, for membership checks on user-supplied tile lists
+_VALID_TILE_TYPES = frozenset(BoardTile.TileType.values)
+
+
 class Question(models.Model):
     """
     Represents a quiz question (math or kanji) that can be triggered on Question tiles.
@@ -1651,6 +1911,35 @@ class SupportCardType(models.Model):
         return self.name
 
 
+# Shared-cache entry holding the active support card types, so every worker sees
+# catalog changes. Writes that skip model signals (QuerySet.update(), bulk writes)
+# are picked up within the TTL.
+ACTIVE_SUPPORT_CARD_TYPES_CACHE_KEY = "support_card_types:active"
+ACTIVE_SUPPORT_CARD_TYPES_CACHE_TTL = 60
+
+
+def active_support_card_types() -> tuple[SupportCardType, ...]:
+    """
+    Returns the active support card types (used by BONUS and SHOP tiles).
+    The result is kept in the shared cache for ACTIVE_SUPPORT_CARD_TYPES_CACHE_TTL
+    seconds; an empty tuple is cached like any other result.
+
+    Returns:
+        tuple[SupportCardType, ...]: the active card types.
+    """
+    types = cache.get(ACTIVE_SUPPORT_CARD_TYPES_CACHE_KEY)
+    if types is None:
+        types = tuple(SupportCardType.objects.filter(is_active=True))
+        cache.set(ACTIVE_SUPPORT_CARD_TYPES_CACHE_KEY, types, ACTIVE_SUPPORT_CARD_TYPES_CACHE_TTL)
+    return types
+
+
+@receiver([post_save, post_delete], sender=SupportCardType)
+def _clear_active_support_card_types(sender, **kwargs):
+    """Drops the cached active card types when a card type is edited or removed."""
+    cache.delete(ACTIVE_SUPPORT_CARD_TYPES_CACHE_KEY)
+
+
 class SupportCardInstance(models.Model):
     """
     Represents a specific instance of a support card owned by a player.
@@ -1666,18 +1955,36 @@ class SupportCardInstance(models.Model):
         related_name="cards",
     )
 
-    is_used = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Set when the card is played; NULL means the card is still in hand
     used_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         ordering = ["owner", "created_at"]
+        indexes = [
+            # A player's hand: owner.cards.filter(used_at__isnull=True)
+            models.Index(fields=["owner"], condition=Q(used_at__isnull=True), name="card_owner_hand_idx"),
+        ]
+
+    @property
+    def is_used(self) -> bool:
+        """Returns True if the card has been played."""
+        return self.used_at is not None
 
     def __str__(self) -> str:
         status = "used" if self.is_used else "in hand"
         return f"{self.card_type.name} ({status}) for {self.owner}"
 
 
+class GameLogManager(models.Manager):
+    """
+    Default GameLog manager: joins the game and player (with its user and game)
+    that GameLog.__str__ renders, so listing logs doesn't issue per-row queries.
+    """
+    def get_queryset(self):
+        return super().get_queryset().select_related("game", "player__user", "player__game")
+
+
 class GameLog(models.Model):
     """
     Logs significant game events for history and audit.
@@ -1723,15 +2030,20 @@ class GameLog(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = GameLogManager()
+
     class Meta:
         ordering = ["created_at"]
+        indexes = [
+            # A game's log in chronological order (game.logs.all())
+            models.Index(fields=["game", "created_at"], name="gamelog_game_created_idx"),
+        ]
 
     def __str__(self) -> str:
         who = self.player or "System"
         return f"[{self.game.code}] {who}: {self.get_action_type_display()}"
 
 
-
 # ============================
 # GAME CHAT
 # ============================
@@ -1820,6 +2132,10 @@ class CardDuelCardType(models.Model):
 
     class Meta:
         ordering = ["category", "code"]
+        indexes = [
+            # build_deck_codes(): filter(is_active=True).order_by("category", "code")
+            models.Index(fields=["is_active", "category", "code"], name="cd_active_cat_code_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"[{self.code}] {self.name}"
@@ -1,4 +1,23 @@
+import itertools
+import operator
+import os
 import random
+import time
+
+# Question ids: import time, the current pid and a per-process counter (next() on a count is
+# atomic under the GIL). The pid is read per call so workers forked from one preloaded parent,
+# which share the epoch and the counter state, still get distinct ids.
+_Q_EPOCH = int(time.time())
+_Q_COUNTER = itertools.count(1)
+
+# Arithmetic operators a question can use: (symbol shown in the prompt, function)
+_OPS = (("+", operator.add), ("-", operator.sub), ("*", operator.mul))
+
+# Non-zero offsets from the correct answer that wrong choices are drawn from, per difficulty
+_WRONG_OFFSETS = {
+    difficulty: tuple(d for d in range(-spread, spread + 1) if d != 0)
+    for difficulty, spread in (("easy", 5), ("normal", 15), ("hard", 40))
+}
 
 def generate_math_question(difficulty="normal"):
     """
@@ -17,40 +36,25 @@ def generate_math_question(difficulty="normal"):
     if difficulty == "easy":
         a = random.randint(1, 12)
         b = random.randint(1, 12)
-        ops = ["+", "-", "*"]
     elif difficulty == "hard":
         a = random.randint(10, 99)
         b = random.randint(10, 99)
-        ops = ["+", "-", "*"]
     else:  # normal
         a = random.randint(1, 30)
         b = random.randint(1, 30)
-        ops = ["+", "-", "*"]
-
-    op = random.choice(ops)
-
-    if op == "+":
-        correct = a + b
-    elif op == "-":
-        correct = a - b
-    else:
-        correct = a * b
-
-    correct_str = str(correct)
 
-    wrongs = set()
-    spread = 5 if difficulty == "easy" else (15 if difficulty == "normal" else 40)
-    while len(wrongs) < 3:
-        cand = correct + random.randint(-spread, spread)
-        if cand != correct:
-            wrongs.add(str(cand))
+    op, fn = random.choice(_OPS)
+    correct = fn(a, b)
 
-    choices = list(wrongs)[:3] + [correct_str]
-    random.shuffle(choices)
+    # Three distinct wrong answers in random order, then the correct one at a random slot
+    offsets = _WRONG_OFFSETS.get(difficulty, _WRONG_OFFSETS["hard"])
+    choices = [str(correct + d) for d in random.sample(offsets, 3)]
+    correct_index = random.randrange(4)
+    choices.insert(correct_index, str(correct))
 
     return {
-        "id": f"q_{random.randint(100000, 999999)}",
+        "id": f"q_{_Q_EPOCH}_{os.getpid()}_{next(_Q_COUNTER)}",
         "prompt": f"What is {a} {op} {b}?",
         "choices": choices,
-        "correct_index": choices.index(correct_str),
+        "correct_index": correct_index,
     }
@@ -1,8 +1,13 @@
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth.models import User
+from django.db import connection
 from django.urls import reverse
 from unittest.mock import patch
 
+from django import forms
+
+from .forms import DEFAULT_TILES, GameCreateForm
 from .models import Game, PlayerInGame, BoardTile, SupportCardInstance, SupportCardType
 
 
@@ -41,7 +46,8 @@ class ViewsBasicTests(TestCase):
             board_length=10,
             max_players=4,
         )
-        # create a simple board with start, safe, and finish to allow movement
+        # create a simple board with start, safe, and finish to allow movement (one INSERT)
+        tiles = []
         for i in range(10):
             if i == 0:
                 t = BoardTile.TileType.START
@@ -49,7 +55,8 @@ class ViewsBasicTests(TestCase):
                 t = BoardTile.TileType.FINISH
             else:
                 t = BoardTile.TileType.SAFE
-            BoardTile.objects.create(game=game, position=i, tile_type=t)
+            tiles.append(BoardTile(game=game, position=i, tile_type=t))
+        BoardTile.objects.bulk_create(tiles)
         # add host as player 0
         PlayerInGame.objects.create(
             game=game, user=host, turn_order=0, hp=3, coins=0, position=0, is_alive=True
@@ -99,7 +106,7 @@ class ViewsBasicTests(TestCase):
             params={},
         )
         me = PlayerInGame.objects.get(game=game, user=self.user)
-        card = SupportCardInstance.objects.create(card_type=sct, owner=me, is_used=False)
+        card = SupportCardInstance.objects.create(card_type=sct, owner=me)
 
         self.login(self.user)
         url = reverse("game:use_card", args=[game.id])
@@ -136,3 +143,48 @@ class ViewsBasicTests(TestCase):
         url = reverse("game:game_roll", args=[game.id])
         resp = self.client.post(url)
         self.assertEqual(resp.status_code, 403)
+
+    def test_game_state_queries_do_not_grow_with_players(self):
+        """Ensure the state endpoint's query count is independent of the player count (no N+1)."""
+        game = self.create_waiting_game(players=1)
+        game.status = Game.Status.ACTIVE
+        game.save(update_fields=["status"])
+
+        self.login(self.user)
+        url = reverse("game:game_state", args=[game.id])
+        self.client.get(url)  # warm-up: fills the board tile cache
+
+        with CaptureQueriesContext(connection) as one_player:
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+        PlayerInGame.objects.create(
+            game=game, user=self.other, turn_order=1, hp=3, coins=0, position=0, is_alive=True
+        )
+        with CaptureQueriesContext(connection) as two_players:
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+        self.assertEqual(len(one_player.captured_queries), len(two_players.captured_queries))
+
+
+class GameCreateFormTests(TestCase):
+    """
+    Tests for the game creation form.
+    """
+    def test_enabled_tiles_uses_static_choices(self):
+        """Ensure tile choices render without queries (no model-backed field)."""
+        form = GameCreateForm()
+        field = form.fields["enabled_tiles"]
+        self.assertIs(type(field), forms.MultipleChoiceField)
+        with self.assertNumQueries(0):
+            str(form["enabled_tiles"])
+
+    def test_empty_enabled_tiles_falls_back_to_all(self):
+        """Ensure leaving every tile unchecked enables all tile types."""
+        form = GameCreateForm(data={
+            "mode": Game.Mode.FINISH,
+            "survival_difficulty": Game.SurvivalDifficulty.NORMAL,
+            "board_length": 35,
+            "max_players": 4,
+        })
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data["enabled_tiles"], list(DEFAULT_TILES))
@@ -2,10 +2,12 @@ import secrets
 import string
 import json
 import random
-import re
+from itertools import accumulate
 from urllib import request
 
 from django.contrib import messages
+from django.core.cache import cache
+from django.utils import timezone
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.forms import UserCreationForm
@@ -14,10 +16,10 @@ from django.http import JsonResponse
 from django.views.decorators.http import require_GET, require_POST
 from django.templatetags.static import static
 
-from .card_duel_seed import seed_card_duel_cards
+from .card_duel_seed import card_spec_for_code, cd_image_url_for_code, seed_card_duel_cards
 
 
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.http import HttpResponse
 
 from . import card_duel
@@ -32,6 +34,7 @@ from .models import (
     SupportCardType,
     GameChatMessage,
     CardDuelCardType,
+    PUBLIC_STATE_JSON_SEPARATORS,
 )
 import game
 
@@ -194,7 +197,21 @@ def generate_game_code(length: int = 6) -> str:
     alphabet = string.ascii_uppercase + string.digits
     return "".join(secrets.choice(alphabet) for _ in range(length))
 
+GAME_CODE_ATTEMPTS = 5
 SURVIVAL_LEN = 35
+
+# Labels of default-board tiles that carry no value (TRAP/HEAL labels depend on difficulty)
+DEFAULT_BOARD_TILE_LABELS = {
+    BoardTile.TileType.BONUS: "BONUS",
+    BoardTile.TileType.QUESTION: "Q",
+    BoardTile.TileType.MASS_WARP: "MASS WARP",
+    BoardTile.TileType.WARP: "WARP",
+    BoardTile.TileType.DUEL: "DUEL",
+    BoardTile.TileType.SHOP: "SHOP",
+    BoardTile.TileType.GUN: "GUN",
+    BoardTile.TileType.SAFE: "SAFE",
+}
+
 CARD_DUEL_START_HP = 20
 CARD_DUEL_START_HAND = 5
 
@@ -441,66 +458,50 @@ def create_default_board_for_game(game: Game, enabled_tiles=None):
         weights_map.pop(BoardTile.TileType.BONUS, None)
 
     allowed = [t for t in weights_map.keys() if (t in enabled_tiles or t == BoardTile.TileType.SAFE)]
-    weights = [weights_map[t] for t in allowed]
-
-    tiles = []
-    last_index = board_len - 1
-
-    for pos in range(board_len):
-        if pos == 0:
-            tiles.append(BoardTile(game=game, position=pos, tile_type=BoardTile.TileType.START, label="START"))
-            continue
-
-        # Last tile rules
-        if pos == last_index:
-            if game.mode == Game.Mode.SURVIVAL:
-                tiles.append(BoardTile(game=game, position=pos, tile_type=BoardTile.TileType.PORTAL, label="PORTAL"))
-            else:
-                tiles.append(BoardTile(game=game, position=pos, tile_type=BoardTile.TileType.FINISH, label="FINISH"))
-            continue
+    # Accumulated once per board rather than inside every random.choices() call
+    cum_weights = list(accumulate(weights_map[t] for t in allowed))
 
+    TT = BoardTile.TileType
+    hard = game.mode == Game.Mode.SURVIVAL and game.survival_difficulty == Game.SurvivalDifficulty.HARD
+    if game.mode == Game.Mode.SURVIVAL:
+        last_type, last_label = TT.PORTAL, "PORTAL"
+    else:
+        last_type, last_label = TT.FINISH, "FINISH"
 
-        tile_type = random.choices(allowed, weights=weights, k=1)[0]
+    # Every middle tile type in one draw
+    picks = random.choices(allowed, cum_weights=cum_weights, k=max(0, board_len - 2))
 
+    tiles = [BoardTile(game=game, position=0, tile_type=TT.START, label="START")]
+    for pos, tile_type in enumerate(picks, start=1):
         value_int = None
-        label = ""
 
-        if tile_type == BoardTile.TileType.TRAP:
-            if game.mode == Game.Mode.SURVIVAL and game.survival_difficulty == Game.SurvivalDifficulty.HARD:
+        if tile_type == TT.TRAP:
+            if hard:
                 value_int = -random.randint(3, 5)
                 label = "TRAP (HARD)"
             else:
                 value_int = -random.randint(1, 2)
                 label = "TRAP"
 
-        elif tile_type == BoardTile.TileType.HEAL:
-            if game.mode == Game.Mode.SURVIVAL and game.survival_difficulty == Game.SurvivalDifficulty.HARD:
+        elif tile_type == TT.HEAL:
+            if hard:
                 value_int = random.randint(1, 2)
                 label = "HEAL (≤2)"
             else:
                 value_int = random.randint(1, 3)
                 label = "HEAL"
 
-        elif tile_type == BoardTile.TileType.BONUS:
-            label = "BONUS"
-        elif tile_type == BoardTile.TileType.QUESTION:
-            label = "Q"
-        elif tile_type == BoardTile.TileType.MASS_WARP:
-            label = "MASS WARP"
-        elif tile_type == BoardTile.TileType.WARP:
-            label = "WARP"
-        elif tile_type == BoardTile.TileType.DUEL:
-            label = "DUEL"
-        elif tile_type == BoardTile.TileType.SHOP:
-            label = "SHOP"
-        elif tile_type == BoardTile.TileType.GUN:
-            label = "GUN"
-        elif tile_type == BoardTile.TileType.SAFE:
-            label = "SAFE"
+        else:
+            label = DEFAULT_BOARD_TILE_LABELS.get(tile_type, "")
 
         tiles.append(BoardTile(game=game, position=pos, tile_type=tile_type, value_int=value_int, label=label))
 
+    # Last tile rules
+    if board_len > 1:
+        tiles.append(BoardTile(game=game, position=board_len - 1, tile_type=last_type, label=last_label))
+
     BoardTile.objects.bulk_create(tiles)
+    cache.delete(game.board_cache_key)
 
 def home(request):
     """Renders the landing page."""
@@ -540,30 +541,39 @@ def game_create(request):
             game: Game = form.save(commit=False)
 
             game.enabled_tiles = form.cleaned_data.get("enabled_tiles") or []
-
-            while True:
-                candidate = generate_game_code()
-                if not Game.objects.filter(code=candidate).exists():
-                    game.code = candidate
-                    break
-
             game.host = request.user
-            game.save()
-
-            # create_default_board_for_game(game, enabled_tiles=game.enabled_tiles)
-
-            PlayerInGame.objects.create(
-                game=game,
-                user=request.user,
-                turn_order=0,
-                hp=3,
-                coins=0,
-                position=0,
-                is_alive=True,
-            )
-
-            messages.success(request, f"Game created with code {game.code}. Share this with your friends.")
-            return redirect("game:game_detail", game_id=game.id)
+
+            # Game and host player commit together
+            with transaction.atomic():
+                # Let the unique index on Game.code reject collisions instead of probing first
+                for _ in range(GAME_CODE_ATTEMPTS):
+                    game.code = generate_game_code()
+                    try:
+                        with transaction.atomic():
+                            game.save()
+                        break
+                    except IntegrityError:
+                        continue
+                else:
+                    game = None
+
+                if game is not None:
+                    # create_default_board_for_game(game, enabled_tiles=game.enabled_tiles)
+
+                    PlayerInGame.objects.create(
+                        game=game,
+                        user=request.user,
+                        turn_order=0,
+                        hp=3,
+                        coins=0,
+                        position=0,
+                        is_alive=True,
+                    )
+
+            if game is not None:
+                messages.success(request, f"Game created with code {game.code}. Share this with your friends.")
+                return redirect("game:game_detail", game_id=game.id)
+            form.add_error(None, "Could not allocate a game code. Please try again.")
     else:
         form = GameCreateForm()
 
@@ -659,19 +669,19 @@ def game_detail(request, game_id: int):
     Displays the game lobby or main detail view.
     Checks user permissions and prepares initial context.
     """
-    game = get_object_or_404(Game, id=game_id)
-    players = game.players.select_related("user").order_by("turn_order")
-    tiles = game.tiles.order_by("position")
+    game = get_object_or_404(Game.objects.select_related("host").with_public_state_prefetch(request.user), id=game_id)
+    # Prefetched in turn order: membership, count and the template all read the same rows
+    players = game.players.all()
     
-    if not players.filter(user=request.user).exists():
+    if not any(p.user_id == request.user.id for p in players):
         if game.host != request.user:
             messages.error(request, "You are not a player in this game.")
             return redirect("game:game_list")
 
     is_host = (game.host == request.user)
-    can_start = is_host and game.status == Game.Status.WAITING and players.count() >= 2
+    can_start = is_host and game.status == Game.Status.WAITING and len(players) >= 2
 
-    state = game.to_public_state(for_user=request.user)
+    state = game.to_public_state(for_user=request.user, players=players)
 
     context = {
         "game": game,
@@ -681,7 +691,6 @@ def game_detail(request, game_id: int):
         "game_state": state,
         "me_player_id": state["you_player_id"],
         "current_player_id": state["current_player_id"],
-        "tiles": tiles,
     }
     return render(request, "game_detail.html", context)
 
@@ -776,6 +785,11 @@ def game_start(request, game_id: int):
         messages.error(request, "Only the host can start the game.")
         return redirect("game:game_detail", game_id=game.id)
 
+    # The board is built here exactly once; cached board tiles rely on it never being rebuilt
+    if game.status != Game.Status.WAITING:
+        messages.error(request, "This game has already started.")
+        return redirect("game:game_detail", game_id=game.id)
+
     players = game.players.all()
     if players.count() < 2:
         messages.error(request, "Need at least 2 players to start the game.")
@@ -852,6 +866,7 @@ def game_delete(request, game_id: int):
         messages.error(request, "You do not have permission to delete this game.")
         return redirect("game:game_list")
 
+    cache.delete(game.board_cache_key)
     game.delete()
     messages.success(request, "Game deleted successfully.")
     return redirect("game:game_list")
@@ -886,17 +901,17 @@ def game_state(request, game_id: int):
     Returns the current game state as JSON for the frontend polling/updates.
     Includes player positions, stats, board state, and mode-specific data (e.g. Draft/Duel).
     """
-    game = get_object_or_404(Game, id=game_id)
+    game = get_object_or_404(Game.objects.select_related("host").with_public_state_prefetch(request.user), id=game_id)
 
-    players = game.players.select_related("user")
-    is_player = players.filter(user=request.user).exists()
+    players = game.players.all()
+    is_player = any(p.user_id == request.user.id for p in players)
     is_host = (game.host == request.user)
 
     if not (is_player or is_host):
         return JsonResponse({"detail": "Forbidden"}, status=403)
 
     MAX_PICKS = 5
-    state = game.to_public_state(for_user=request.user)
+    state = game.to_public_state(for_user=request.user, players=players)
     state = enrich_draft_options(state)
 
     if game.mode == Game.Mode.CARD_DUEL:
@@ -918,14 +933,12 @@ def game_state(request, game_id: int):
                     
                     # 3. IF DB IS EMPTY, SEED IT NOW
                     if not deck_codes:
-                        seed_card_duel_cards() 
+                        seed_card_duel_cards(force=True)
                         deck_codes = card_duel.build_deck_codes()
 
                     # 4. Rebuild player deck
                     if deck_codes:
-                        import random
-                        me.cd_deck = list(deck_codes)
-                        random.shuffle(me.cd_deck)
+                        me.cd_deck = random.sample(deck_codes, len(deck_codes))
 
                 # 5. Deal options from the (now hopefully populated) deck
                 if me.cd_deck:
@@ -941,11 +954,10 @@ def game_state(request, game_id: int):
                 for c in codes:
                     t = types.get(c)
                     title = (t.name if t else c)
-                    img = _cd_image_filename(title)
                     options_payload.append({
                         "code": c,
                         "title": title,
-                        "image_url": static(f"images/CardDuelCards/{img}"),
+                        "image_url": cd_image_url_for_code(c, title),
                     })
 
                 pick_payload = {
@@ -992,7 +1004,10 @@ def game_state(request, game_id: int):
         else:
             state["card_duel_pick"] = {"active": False}
 
-    return JsonResponse(state)
+    return JsonResponse(
+        state,
+        json_dumps_params={"separators": PUBLIC_STATE_JSON_SEPARATORS, "ensure_ascii": False},
+    )
 
 
 @login_required
@@ -1003,13 +1018,15 @@ def game_roll(request, game_id: int):
     Executes a dice roll for the current player.
     Validates turn order and strictly blocking states (Pending Question/Shop/Duel).
     """
-    game = get_object_or_404(Game, id=game_id)
+    # Lock row so concurrent rolls serialize instead of both passing the turn check
+    game = get_object_or_404(Game.objects.select_for_update(), id=game_id)
 
     if game.status != Game.Status.ACTIVE:
         return JsonResponse({"detail": "Game is not active."}, status=400)
 
     try:
-        player = game.players.select_related("user").get(user=request.user)
+        # Lock the roller's row too: use_card writes it without taking the game lock
+        player = game.players.select_for_update(of=("self",)).select_related("user").get(user=request.user)
     except PlayerInGame.DoesNotExist:
         return JsonResponse({"detail": "You are not a player in this game."}, status=403)
 
@@ -1239,8 +1256,7 @@ def answer_question(request, game_id: int):
 
     # Clear question and advance turn
     game.pending_question = None
-    game.save(update_fields=["pending_question"])
-    game.advance_turn()
+    game.advance_turn(unsaved_fields=["pending_question"])
 
     state = game.to_public_state(for_user=request.user)
 
@@ -1326,7 +1342,7 @@ def shop_sell(request, game_id: int):
         return JsonResponse({"detail": "Invalid payload."}, status=400)
 
     inst = SupportCardInstance.objects.select_related("card_type").filter(
-        id=card_instance_id, owner=me, is_used=False
+        id=card_instance_id, owner=me, used_at__isnull=True
     ).first()
     if not inst:
         return JsonResponse({"detail": "Card not found."}, status=404)
@@ -1364,8 +1380,7 @@ def shop_close(request, game_id: int):
         return JsonResponse({"detail": "It is not your shop."}, status=403)
 
     game.pending_shop = None
-    game.save(update_fields=["pending_shop"])
-    game.advance_turn()
+    game.advance_turn(unsaved_fields=["pending_shop"])
 
     return JsonResponse({"game_state": game.to_public_state(for_user=request.user)})
 
@@ -1410,8 +1425,7 @@ def gun_attack(request, game_id: int):
 
     # clear pending gun and advance turn
     game.pending_gun = None
-    game.save(update_fields=["pending_gun"])
-    game.advance_turn()
+    game.advance_turn(unsaved_fields=["pending_gun"])
 
     return JsonResponse({
         "action": "gun_attack",
@@ -1444,8 +1458,7 @@ def gun_skip(request, game_id: int):
 
     # Clear gun action and skip this player's turn
     game.pending_gun = None
-    game.save(update_fields=["pending_gun"])
-    game.advance_turn()
+    game.advance_turn(unsaved_fields=["pending_gun"])
 
     return JsonResponse({
         "action": "gun_skip",
@@ -1458,10 +1471,11 @@ def game_board(request, game_id: int):
     Renders the game board UI.
     Dispatches to 'card_duel.html' if mode is Card Duel, otherwise 'game_board.html'.
     """
-    game = get_object_or_404(Game, id=game_id)
-    
-    players_qs = game.players.select_related("user")
-    is_player = players_qs.filter(user=request.user).exists()
+    game = get_object_or_404(Game.objects.select_related("host").with_public_state_prefetch(request.user), id=game_id)
+
+    # Prefetched in turn order (see Game.objects.with_public_state_prefetch())
+    players_ordered = game.players.all()
+    is_player = any(p.user_id == request.user.id for p in players_ordered)
     is_host = (game.host == request.user)
 
     if not (is_player or is_host):
@@ -1472,19 +1486,17 @@ def game_board(request, game_id: int):
         messages.info(request, "Game is not active yet.")
         return redirect("game:game_detail", game_id=game.id)
 
-    state = game.to_public_state(for_user=request.user)
+    state = game.to_public_state(for_user=request.user, players=players_ordered)
     state = enrich_draft_options(state)
 
-    tiles_qs = game.tiles.order_by("position")
-    players_ordered = players_qs.order_by("turn_order")
-
     context = {
         "game": game,
         "game_state": state,
         "me_player_id": state["you_player_id"],
         "current_player_id": state["current_player_id"],
         "players": players_ordered,
-        "tiles": tiles_qs,
+        # Serialized (and cached) board from the state: no second tiles query for the ring
+        "tiles": state["tiles"],
     }
     template = "game_board.html"
     if game.mode == Game.Mode.CARD_DUEL:
@@ -1516,11 +1528,13 @@ def use_card(request, game_id):
     if not me:
         return JsonResponse({"detail": "You are not in this game."}, status=403)
 
-    card = SupportCardInstance.objects.select_related("card_type", "owner").filter(
-        id=card_id, owner=me, is_used=False
+    # The owner is `me` (already loaded with its user), so only the card type is joined
+    card = SupportCardInstance.objects.select_related("card_type").filter(
+        id=card_id, owner=me, used_at__isnull=True
     ).first()
     if not card:
         return JsonResponse({"detail": "Card not found (or already used)."}, status=404)
+    card.owner = me
 
     ctype = card.card_type
     et = ctype.effect_type
@@ -1542,22 +1556,22 @@ def use_card(request, game_id):
         me.save(update_fields=["extra_rolls"])
 
     elif et == "swap_position":
-        candidates = (
+        # Let the database pick one random candidate instead of loading them all
+        target = (
             game.players.filter(is_alive=True)
             .exclude(id=me.id)
             .filter(position__gt=me.position)
+            .order_by("?")
+            .first()
         )
 
-        if not candidates.exists():
+        if target is None:
             return JsonResponse({"detail": "No alive player ahead of you to swap with."}, status=400)
 
-        target = random.choice(list(candidates))
-
         me_pos = me.position
         me.position = target.position
         target.position = me_pos
-        me.save(update_fields=["position"])
-        target.save(update_fields=["position"])
+        PlayerInGame.objects.bulk_update([me, target], ["position"])
 
 
     elif et == "change_question":
@@ -1588,8 +1602,8 @@ def use_card(request, game_id):
     else:
         return JsonResponse({"detail": f"Unsupported card effect: {et}"}, status=400)
 
-    card.is_used = True
-    card.save(update_fields=["is_used"])
+    card.used_at = timezone.now()
+    card.save(update_fields=["used_at"])
 
     return JsonResponse({"game_state": game.to_public_state(for_user=request.user)})
 
@@ -1655,11 +1669,14 @@ def _cd_cleanse(player: PlayerInGame, remove_count: int = 1, allowed_types=None)
 def _cd_draw(player: PlayerInGame, n: int) -> int:
     """Draws n cards from the player's personal deck to hand."""
     n = max(0, int(n or 0))
-    deck = list(player.cd_deck or [])
-    hand = list(player.cd_hand or [])
+    deck = player.cd_deck or []
+    hand = player.cd_hand or []
     drawn = deck[:n]
-    player.cd_hand = hand + drawn
-    player.cd_deck = deck[n:]
+    # Trim and extend in place rather than copying the whole deck and hand
+    del deck[:n]
+    hand.extend(drawn)
+    player.cd_hand = hand
+    player.cd_deck = deck
     return len(drawn)
 
 def _cd_last_played_payload(player: PlayerInGame):
@@ -1693,11 +1710,10 @@ def _cd_build_state_for_user(game: Game, user) -> dict:
         for c in codes:
             t = types.get(c)
             title = (t.name if t else c)
-            img = _cd_image_filename(title)
             options_payload.append({
                 "code": c,
                 "title": title,
-                "image_url": static(f"images/CardDuelCards/{img}"),
+                "image_url": cd_image_url_for_code(c, title),
             })
 
         pick_payload = {
@@ -1999,7 +2015,6 @@ def card_duel_play_card(request, game_id: int):
 
     elif et == CardDuelCardType.EffectType.GAMBLE:
         win_chance = float(params.get("win_chance", 0.5))
-        import random
         is_win = random.random() < win_chance
         
         outcome_def = params.get("win") if is_win else params.get("loss")
@@ -2047,8 +2062,7 @@ def card_duel_play_card(request, game_id: int):
         op_shield = int(getattr(opp, "shield_points", 0) or 0)
         me.shield_points = op_shield
         opp.shield_points = my_shield
-        me.save(update_fields=["shield_points"])
-        opp.save(update_fields=["shield_points"])
+        PlayerInGame.objects.bulk_update([me, opp], ["shield_points"])
         result["details"] = {"swapped": True, "my_shield": me.shield_points, "op_shield": opp.shield_points}
 
     elif et == CardDuelCardType.EffectType.HEAL_AND_SHIELD:
@@ -2070,7 +2084,6 @@ def card_duel_play_card(request, game_id: int):
         
         discarded_codes = []
         if to_discard_count > 0:
-            import random
             random.shuffle(current_hand)
             discarded_codes = current_hand[:to_discard_count]
             kept = current_hand[to_discard_count:]
@@ -2482,85 +2495,21 @@ def _cd_card_payload_from_code(code: str):
     Converts a stored Card Duel card code (e.g. CD_STRIKE_5) into a dict:
     {code, title, image_url}
     """
-    from .models import CardDuelCardType  # adjust import if your models path differs
-
-    t = CardDuelCardType.objects.filter(code=code).first()
-    title = t.name if t else code
-    img = _cd_image_filename(title)
+    spec = card_spec_for_code(code)
+    if spec is not None:
+        title = spec.name
+    else:
+        t = CardDuelCardType.objects.filter(code=code).only("name").first()
+        title = t.name if t else code
     return {
         "code": code,
         "title": title,
-        "image_url": static(f"images/CardDuelCards/{img}"),
+        "image_url": cd_image_url_for_code(code, title),
     }
 
 def _safe_len(x):
     return len(x) if x else 0
 
-def _cd_image_filename(card_name: str) -> str:
-    """
-    Maps card names from seed data to actual filenames in static/images/CardDuelCards/
-    """
-    name = (card_name or "").strip()
-    
-    # Mapping of card names to their image files based on FUNCTION/EFFECT
-    # Each card is mapped to an image that represents what it DOES
-    mapping = {
-        # === PLUS STATUS CARDS (Buffs/Healing) ===
-        "Battle Focus": "BattleFocus.png",        # +2 damage for 2 turns
-        "Iron Skin": "IronSkin.png",              # Gain 6 shield
-        "Purify Aura": "PurifyAura.png",          # Remove all negative effects
-        "Regen Brew": "RegenBrew.png",            # Heal 2 HP for 2 turns (regen)
-        "Heal": "RestoreHp.png",                  # Restore 5 HP instantly
-        
-        # === MINUS STATUS CARDS (Debuffs/Damage over time) ===
-        "Poison": "PoisonNeedle.png",             # 1 damage for 3 turns
-        "Burn": "BurningMark.png",                # 2 damage for 2 turns
-        "Weaken": "WeakenCurse.png",              # Target deals 2 less damage
-        "Vulnerable": "StunShock.png",            # Target takes +1 damage (using stun image)
-        "Silence Seal": "SilenceSeal.png",        # Block ALL cards for 1 turn
-        "Stun Shock": "StunShock.png",            # Block action cards for 1 turn
-        
-        # === NEUTRAL CARDS (Utility) ===
-        "Adrenaline": "Adrenaline.png",           # Draw +1 card next turn
-        "Card Cycle": "CardCycle.png",            # Change up to 2 cards in hand
-        "Guard Swap": "GuardSwap.png",            # Swap shields with enemy
-        "Quick Fix": "QuickFix.png",              # Heal 2 + Shield 2
-        "Weaken Curse": "WeakenCurse.png",        # Enemy deals 50% less damage
-        
-        # === BONUS CARDS (Special effects) ===
-        "Amplify": "Amplify.png",                 # Next heal +3 HP
-        "Antidote Kit": "AntidoteKit.png",        # Remove poison & burn, heal 1
-        "Counter Stance": "CounterStance.png",    # Reflect 3 damage once
-        "Gamble Coin": "GambleCoin.png",          # 50% shield +8 OR take 3 damage
-        "Lucky Draw": "LuckyDraw.png",            # Draw 2 cards
-        
-        # === LEGACY BONUS CARDS (Attack + Status) ===
-        "Venom Strike": "PoisonNeedle.png",       # Deal 3 damage + poison (function: poison attack)
-        "Flame Jab": "BurningMark.png",           # Deal 3 damage + burn (function: burn attack)
-        "Holy Light": "RestoreHp.png",            # Heal 3 + regen (function: healing)
-        "Crippling Shot": "WeakenCurse.png",      # Deal 4 damage + weaken (function: weaken attack)
-        
-        # === OTHER ATTACK CARDS ===
-        "Pierce": "Strike.png",                   # Attack card (piercing damage)
-        "Strike": "Strike.png",                   # Basic attack
-        "Sunder": "StunShock.png",                # Attack with stun effect
-        
-        # === LEGACY CARDS (from old database) ===
-        "Cleanse": "AntidoteKit.png",             # Remove negative effects (similar to Purify Aura)
-        "Tactical Draw": "CardCycle.png",         # Draw/cycle cards
-        "Bless": "PurifyAura.png",                # Buff/blessing effect
-        "Focus": "BattleFocus.png",               # Focus/concentration buff
-        "Regen": "RegenBrew.png",                 # Regeneration effect
-        "Shield Up": "IronSkin.png",              # Shield/defense buff
-    }
-    
-    if name in mapping:
-        return mapping[name]
-
-    # Fallback to simple removal of spaces if not found
-    base = re.sub(r"[^A-Za-z0-9]+", " ", name).title().replace(" ", "")
-    return f"{base}.png"
-
 def _json_ok(game, request, extra=None):
     payload = {"ok": True, "game_state": game.to_public_state(for_user=request.user)}
     if extra:
@@ -2605,14 +2554,14 @@ def _compute_scores(a_choice, a_pred, b_choice, b_pred):
     return a, b
 
 
-def _end_turn_safely(game):
-    """Advance turn while skipping eliminated players."""
+def _end_turn_safely(game, unsaved_fields=()):
+    """Advance turn while skipping eliminated players (saving `unsaved_fields` in the same UPDATE)."""
     if hasattr(game, "advance_turn") and callable(getattr(game, "advance_turn")):
-        game.advance_turn()
+        game.advance_turn(unsaved_fields=unsaved_fields)
         return
 
     game.current_turn_index = (int(game.current_turn_index or 0) + 1) % max(game.players.count(), 1)
-    game.save(update_fields=["current_turn_index"])
+    game.save(update_fields=["current_turn_index", *unsaved_fields])
 
 
 def _apply_hp_damage_with_shield(player, dmg: int) -> bool:
@@ -2736,11 +2685,11 @@ def duel_commit(request, game_id):
 
     if choice == "bluff":
         # "any support card": consume any unused card from inventory
-        card = me.cards.select_related("card_type").filter(is_used=False).first()
+        card = me.cards.select_related("card_type").filter(used_at__isnull=True).first()
         if card is None:
             return _json_err(game, request, "Bluff requires any support card.", status=400)
-        card.is_used = True
-        card.save(update_fields=["is_used"])
+        card.used_at = timezone.now()
+        card.save(update_fields=["used_at"])
 
     choices[me_key] = choice
     pd["choices"] = choices
@@ -2825,8 +2774,7 @@ def duel_predict(request, game_id):
 
             # clear duel + end turn
             game.pending_duel = None
-            game.save(update_fields=["pending_duel"])
-            _end_turn_safely(game)
+            _end_turn_safely(game, unsaved_fields=["pending_duel"])
             return _json_ok(game, request, extra={"resolved": True, "draw": True})
 
         # winner exists -> winner must choose reward
@@ -2916,7 +2864,7 @@ def duel_choose_reward(request, game_id):
         effects["extra"]["duel"]["loser_position_after"] = loser.position
 
     elif action == "steal_card":
-        stolen = loser.cards.select_related("card_type").filter(is_used=False).order_by("?").first()
+        stolen = loser.cards.select_related("card_type").filter(used_at__isnull=True).order_by("?").first()
         if stolen:
             # Your inventory relation is me.cards, so card likely has FK to player model named "player"
             # We try common names safely.
@@ -2935,8 +2883,7 @@ def duel_choose_reward(request, game_id):
 
     # Clear duel and end turn
     game.pending_duel = None
-    game.save(update_fields=["pending_duel"])
-    _end_turn_safely(game)
+    _end_turn_safely(game, unsaved_fields=["pending_duel"])
 
     return _json_ok(game, request, extra={"effects": effects, "resolved": True})
 
@@ -2970,10 +2917,9 @@ def duel_skip(request, game_id: int):
 
     # Clear duel and skip/advance turn (same behavior style as gun_skip)
     game.pending_duel = None
-    game.save(update_fields=["pending_duel"])
 
     # Prefer your helper (handles end_turn if you have it)
-    _end_turn_safely(game)
+    _end_turn_safely(game, unsaved_fields=["pending_duel"])
 
     return JsonResponse({
         "action": "duel_skip",